@@ -8,7 +8,9 @@ Claude Code Think Aloud Hook
 Triggers on: PreToolUse, Stop, Notification
 
 Functionality:
-1. Extract last thinking content from transcript
+1. Extract last thinking content from transcript (skipped on Notification,
+   or when the transcript is unchanged since the previous run; otherwise only
+   the part appended since the previous run is scanned)
 2. Skip if no thinking found or same as previous
 3. Call translation+TTS API to speak the thinking
 4. Additional notifications:
@@ -24,16 +26,32 @@ Hook behavior: Always allows (never blocks operations)
 import sys
 import json
 import os
-import hashlib
 from pathlib import Path
 from typing import Any, Dict, Optional
-from urllib import request
-from urllib.error import HTTPError, URLError
+# hashlib and http.client are imported lazily: the hook is a fresh process per
+# event and the HTTP stack costs several ms of import time on paths that never POST
+
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads  # 2-5x faster than json.loads, accepts bytes directly
+    _json_dumps = orjson.dumps  # Returns UTF-8 bytes, no separate encode step
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 
 # Configuration
 API_URL = "http://127.0.0.1:8765/translate_and_speak"
 STATE_FILE = Path(__file__).parent / ".last_thinking_hash"
+TRANSCRIPT_STATE_FILE = Path(__file__).parent / ".last_transcript_state"
+TRANSCRIPT_CHUNK_SIZE = 64 * 1024  # Bytes read per step when scanning transcript backward
+API_TIMEOUT = 5  # Seconds
+API_HEADERS = {"Content-Type": "application/json"}
+
+# Keep-alive connection shared by the thinking and notification POSTs of one run
+_api_connection = None
 
 
 def log_error(message: str):
@@ -44,21 +62,73 @@ def log_error(message: str):
 
 def read_stdin_json() -> Dict[str, Any]:
     """Read hook input JSON from stdin."""
-    data = sys.stdin.read()
+    data = sys.stdin.buffer.read()
     try:
-        return json.loads(data) if data.strip() else {}
+        return _json_loads(data) if data.strip() else {}
     except Exception as e:
         log_error(f"Failed to parse stdin JSON: {e}")
         return {}
 
 
-def iter_transcript_lines(path: str):
-    """Yield each line from transcript JSONL file."""
+def _line_start(f, offset: int) -> int:
+    """
+    Get the offset where the line containing byte offset - 1 begins.
+
+    Returns 0 if no line break is found within TRANSCRIPT_CHUNK_SIZE bytes before
+    offset (callers then fall back to scanning the whole file).
+    """
+    block_start = max(0, offset - TRANSCRIPT_CHUNK_SIZE)
+    f.seek(block_start)
+    newline = f.read(offset - block_start).rfind(b"\n")
+    return 0 if newline == -1 else block_start + newline + 1
+
+
+def iter_transcript_lines_reverse(path: str, start: int = 0):
+    """
+    Yield each non-empty line from transcript JSONL file, last line first.
+
+    Reads the file backward in TRANSCRIPT_CHUNK_SIZE blocks, so finding a record
+    near the end only reads the tail instead of the whole transcript.
+
+    Args:
+        path: Transcript path
+        start: Byte offset to stop at (e.g. file size at the previous scan); a line
+            that was still being written at that offset is yielded in full
+    """
     try:
-        with open(os.path.expanduser(path), "r", encoding="utf-8") as f:
-            for line in f:
+        with open(os.path.expanduser(path), "rb") as f:
+            position = f.seek(0, os.SEEK_END)
+            if start > 0:
+                start = _line_start(f, min(start, position))
+            pending = []  # Pieces of a line spanning chunks, last piece first
+
+            while position > start:
+                read_size = min(TRANSCRIPT_CHUNK_SIZE, position - start)
+                position -= read_size
+                f.seek(position)
+                chunk = f.read(read_size)
+
+                lines = chunk.split(b"\n")
+                if len(lines) == 1:
+                    # No newline in this chunk: whole chunk belongs to the pending line
+                    pending.append(chunk)
+                    continue
+
+                pending.append(lines[-1])
+                line = b"".join(reversed(pending))
                 if line.strip():
                     yield line
+
+                for line in reversed(lines[1:-1]):
+                    if line.strip():
+                        yield line
+
+                # First piece may continue in the previous chunk
+                pending = [lines[0]]
+
+            line = b"".join(reversed(pending))
+            if line.strip():
+                yield line
     except Exception as e:
         log_error(f"Failed to read transcript: {e}")
         return
@@ -93,29 +163,34 @@ def extract_thinking_from_record(record: Dict[str, Any]) -> Optional[str]:
         return None
 
 
-def get_last_thinking(transcript_path: Optional[str]) -> Optional[str]:
-    """Get the last thinking content from transcript."""
+def get_last_thinking(transcript_path: Optional[str], start: int = 0) -> Optional[str]:
+    """Get the last thinking content from transcript (scans from the end back to start)."""
     if not transcript_path:
         return None
 
-    last_thinking = None
-    for line in iter_transcript_lines(transcript_path):
+    for line in iter_transcript_lines_reverse(transcript_path, start):
+        # Cheap byte check: records without a thinking block never need decoding
+        if b'"thinking"' not in line:
+            continue
+
         try:
-            record = json.loads(line)
+            record = _json_loads(line)
         except Exception as e:
             log_error(f"Failed to parse transcript line: {e}")
             continue
 
         thinking = extract_thinking_from_record(record)
         if thinking:
-            last_thinking = thinking
+            return thinking
 
-    return last_thinking
+    return None
 
 
 def compute_hash(text: str) -> str:
-    """Compute MD5 hash of text for comparison."""
-    return hashlib.md5(text.encode("utf-8")).hexdigest()
+    """Compute BLAKE2b (128-bit) hash of text for comparison."""
+    import hashlib
+
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def read_last_hash() -> Optional[str]:
@@ -138,53 +213,117 @@ def write_last_hash(hash_value: str):
         log_error(f"Failed to write state file: {e}")
 
 
+def get_transcript_state(transcript_path: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Get a cheap fingerprint (path, size, mtime) of the transcript file."""
+    if not transcript_path:
+        return None
+    try:
+        path = os.path.expanduser(transcript_path)
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return {"path": path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def read_transcript_state() -> Optional[Dict[str, Any]]:
+    """Read the transcript fingerprint saved by the previous run."""
+    try:
+        return _json_loads(TRANSCRIPT_STATE_FILE.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log_error(f"Failed to read transcript state file: {e}")
+        return None
+
+
+def write_transcript_state(state: Dict[str, Any]):
+    """Write the fingerprint of the transcript that was just scanned."""
+    try:
+        TRANSCRIPT_STATE_FILE.write_bytes(_json_dumps(state))
+    except Exception as e:
+        log_error(f"Failed to write transcript state file: {e}")
+
+
+def _get_api_connection():
+    """Get the keep-alive connection to the API server, opening it on first use."""
+    global _api_connection
+    if _api_connection is None:
+        from http.client import HTTPConnection
+        from urllib.parse import urlsplit
+
+        url = urlsplit(API_URL)
+        _api_connection = HTTPConnection(url.hostname, url.port, timeout=API_TIMEOUT)
+    return _api_connection
+
+
+def _close_api_connection():
+    """Drop the API connection so the next call reconnects."""
+    global _api_connection
+    if _api_connection is not None:
+        _api_connection.close()
+        _api_connection = None
+
+
 def call_translation_tts_api(text: str) -> bool:
     """
     Call translation+TTS API with thinking content.
 
+    Reuses one keep-alive connection across calls, so sending the thinking and
+    the notification costs a single TCP handshake.
+
     Returns:
         True if successful, False otherwise
     """
-    try:
-        payload = {
-            "text": text,
-            "return_audio": False
-        }
-
-        req = request.Request(
-            API_URL,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
-
-        with request.urlopen(req, timeout=5) as response:
-            status_code = response.getcode()
-            response_body = response.read().decode("utf-8")
+    from http.client import HTTPException, RemoteDisconnected
+    from urllib.parse import urlsplit
 
-            if status_code == 202:
-                return True
-            else:
-                log_error(f"Unexpected status code: {status_code}")
-                log_error(f"Response: {response_body}")
-                return False
+    body = _json_dumps({
+        "text": text,
+        "return_audio": False
+    })
 
-    except HTTPError as e:
-        log_error(f"HTTP error: {e.code}")
+    for attempt in range(2):
+        reused = _api_connection is not None
         try:
-            error_body = e.read().decode("utf-8")
-            log_error(f"Response: {error_body}")
-        except:
-            pass
-        return False
+            conn = _get_api_connection()
+            conn.request(
+                "POST",
+                urlsplit(API_URL).path,
+                body=body,
+                headers=API_HEADERS
+            )
+            response = conn.getresponse()
+            status_code = response.status
+            response_body = response.read().decode("utf-8")
+            break
 
-    except URLError as e:
-        log_error(f"URL error: {e.reason}")
-        return False
+        except (RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+            # Server closed an idle keep-alive connection: reconnect once
+            _close_api_connection()
+            if reused and attempt == 0:
+                continue
+            log_error(f"Connection error: {e}")
+            return False
 
-    except Exception as e:
-        log_error(f"API call failed: {e}")
-        return False
+        except (HTTPException, OSError) as e:
+            _close_api_connection()
+            log_error(f"Connection error: {e}")
+            return False
+
+        except Exception as e:
+            _close_api_connection()
+            log_error(f"API call failed: {e}")
+            return False
+
+    if status_code == 202:
+        return True
+
+    if status_code >= 400:
+        log_error(f"HTTP error: {status_code}")
+    else:
+        log_error(f"Unexpected status code: {status_code}")
+    log_error(f"Response: {response_body}")
+    return False
 
 
 def get_additional_notification(hook_event: Optional[str], message: Optional[str]) -> Optional[str]:
@@ -214,8 +353,25 @@ def main():
     hook_event = hook_input.get("hook_event_name")  # "PreToolUse", "Stop", or "Notification"
     message = hook_input.get("message")  # Notification message
 
-    # Extract last thinking
-    thinking = get_last_thinking(transcript_path)
+    # Extract last thinking. Notification always follows a PreToolUse/Stop event
+    # that already spoke the latest thinking, so skip the transcript read there
+    thinking = None
+    if hook_event != "Notification":
+        # Transcript unchanged since the last run: its last thinking was already handled
+        transcript_state = get_transcript_state(transcript_path)
+        last_state = read_transcript_state()
+        if transcript_state is None or transcript_state != last_state:
+            # Transcript is append-only: thinking up to the last scanned size was
+            # already handled, so only the bytes added since then need scanning
+            start = 0
+            if (transcript_state and last_state
+                    and last_state.get("path") == transcript_state["path"]
+                    and 0 < last_state.get("size", 0) <= transcript_state["size"]):
+                start = last_state["size"]
+
+            thinking = get_last_thinking(transcript_path, start)
+            if transcript_state is not None:
+                write_transcript_state(transcript_state)
 
     # Check if additional notification is needed
     additional_notification = get_additional_notification(hook_event, message)
@@ -14,18 +14,26 @@ Architecture:
 """
 
 import asyncio
+import hashlib
+import itertools
 import logging
 import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional
-from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, field_validator
 
-from server.config import load_config
+from server.config import build_config, load_config
 from server.core.tts_factory import create_tts_engine_with_health_check
+from server.core.translation import (
+    close_translation_client,
+    get_translation_cache_stats,
+    warmup_translation_model,
+)
+from server.core.translation_logger import close_translation_logger, initialize_translation_logger
 from server.core.translation_tts_worker import TranslationTTSWorkerSystem
 from server.models import TranslateAndSpeakRequest, TranslateAndSpeakResponse
 
@@ -45,17 +53,104 @@ class HealthResponse(BaseModel):
     tts_queue_size: int = Field(..., description="TTS queue size")
     translation_stats: Dict[str, Any] = Field(..., description="Translation worker statistics")
     tts_stats: Dict[str, Any] = Field(..., description="TTS worker statistics")
+    dedup_stats: Dict[str, int] = Field(..., description="Duplicate request cache hits/misses")
+    translation_cache_stats: Dict[str, Any] = Field(..., description="Translation result cache hits/misses/hit ratio")
+    warmup_ms: Dict[str, Optional[float]] = Field(..., description="Startup warm-up time per model (None if it failed)")
+
+
+# Deduplication defaults (prevent duplicate requests from concurrent hooks)
+DEDUP_WINDOW = 1.0  # seconds
+DEDUP_CACHE_SIZE = 256
+
+
+class RequestDeduplicator:
+    """
+    Remembers recently accepted texts to skip duplicate requests.
+
+    Remembers every text accepted in the window (not just the last one), so
+    alternating hooks sending the same two texts are still deduplicated.
+    Only used from the event loop with no await inside, so no lock is needed.
+    """
+
+    def __init__(self, window: float = DEDUP_WINDOW, max_size: int = DEDUP_CACHE_SIZE):
+        self.window = window
+        self.max_size = max_size
+        self._recent: "OrderedDict[bytes, float]" = OrderedDict()  # Text hash -> first seen (oldest first)
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    def is_duplicate(self, text: str) -> bool:
+        """Check if the same text was accepted within the window, recording it if not."""
+        now = time.monotonic()
+
+        # Expire old entries (insertion order is time order)
+        recent = self._recent
+        while recent:
+            oldest_key, seen_at = next(iter(recent.items()))
+            if now - seen_at <= self.window:
+                break
+            del recent[oldest_key]
+
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+        if key in recent:
+            self.stats["hits"] += 1
+            return True
+
+        recent[key] = now
+        if len(recent) > self.max_size:
+            recent.popitem(last=False)
+        self.stats["misses"] += 1
+        return False
+
+
+# /health responses are reused for this long (uptime checks poll it several times a second)
+HEALTH_CACHE_TTL = 0.25  # seconds
+
+# Per-process request IDs (short hex, used in logs and temporary WAV filenames)
+_request_counter = itertools.count(1)
+
+
+def _next_request_id() -> str:
+    """Get the next request ID (a counter is enough: IDs only need to be unique per process)."""
+    return f"{next(_request_counter):x}"
+
+
+async def _warmup_translation() -> Optional[float]:
+    """
+    Warm up the Ollama translation model (failures are logged, not raised).
+
+    Returns:
+        Warm-up time in milliseconds, or None if it failed
+    """
+    start = time.perf_counter()
+    try:
+        await warmup_translation_model()
+    except asyncio.TimeoutError:
+        logger.warning("  Translation model warm-up timed out (first request will load it)")
+        return None
+    except Exception as e:
+        logger.warning("  Translation model warm-up failed (first request will load it): %s", e)
+        return None
+    elapsed = time.perf_counter() - start
+    logger.info("  Translation model loaded in %.2fs", elapsed)
+    return round(elapsed * 1000, 1)
 
 
-# Global state (will be initialized in lifespan)
-_config: Optional[Dict[str, Any]] = None
-_tts_engine: Optional[Any] = None  # VoicevoxEngine instance
-_translation_tts_worker: Optional[TranslationTTSWorkerSystem] = None
+async def _warmup_tts(tts_engine: Any) -> Optional[float]:
+    """
+    Warm up the VOICEVOX speaker model (failures are logged, not raised).
 
-# Deduplication state (prevent duplicate requests from concurrent hooks)
-_last_translation: Optional[str] = None  # Track last translation text
-_last_translation_time: Optional[float] = None  # Track last translation timestamp
-_dedup_lock: asyncio.Lock = asyncio.Lock()  # Protect deduplication check
+    Returns:
+        Warm-up time in milliseconds, or None if it failed
+    """
+    start = time.perf_counter()
+    try:
+        await tts_engine.warmup()
+    except Exception as e:
+        logger.warning("  VOICEVOX speaker warm-up failed (first request will load it): %s", e)
+        return None
+    elapsed = time.perf_counter() - start
+    logger.info("  VOICEVOX speaker loaded in %.2fs", elapsed)
+    return round(elapsed * 1000, 1)
 
 
 @asynccontextmanager
@@ -67,7 +162,8 @@ async def lifespan(app: FastAPI):
     - Startup: Load config, initialize VOICEVOX, start Translation+TTS workers
     - Shutdown: Stop workers, cleanup resources
     """
-    global _config, _tts_engine, _translation_tts_worker
+    tts_engine = None
+    translation_tts_worker = None
 
     # Startup
     logger.info("="*60)
@@ -76,27 +172,45 @@ async def lifespan(app: FastAPI):
 
     try:
         # Load configuration
-        config_path = None  # Use default config for now
-        _config = load_config(config_path)
+        config = build_config(load_config("config.yaml"))
+        app.state.config = config
+        app.state.deduplicator = RequestDeduplicator()
         logger.info("Configuration loaded successfully")
 
         # Initialize VOICEVOX TTS Engine and Translation+TTS Worker System
         logger.info("Initializing Translation+TTS system...")
         try:
-            # Initialize VOICEVOX TTS engine with health check
-            config_path = Path("config.yaml")
-            _tts_engine = await create_tts_engine_with_health_check(config_path)
-            logger.info(f"  VOICEVOX TTS Engine initialized")
-            logger.info(f"  Speaker ID: {_tts_engine.speaker_id}")
-            logger.info(f"  Base URL: {_tts_engine.base_url}")
+            # Initialize VOICEVOX TTS engine with health check while Ollama
+            # loads the translation model in parallel
+            tts_engine, translation_warmup_ms = await asyncio.gather(
+                create_tts_engine_with_health_check(config.voicevox),
+                _warmup_translation()
+            )
+            logger.info("  VOICEVOX TTS Engine initialized")
+            logger.info("  Speaker ID: %s", tts_engine.speaker_id)
+            logger.info("  Base URL: %s", tts_engine.base_url)
+
+            # Load the speaker model now so the first request doesn't pay for it
+            app.state.warmup_ms = {
+                "translation": translation_warmup_ms,
+                "tts": await _warmup_tts(tts_engine),
+            }
+
+            # Resolve git hash and log path now, not on the first translation
+            await asyncio.to_thread(initialize_translation_logger)
 
             # Initialize dual-queue worker system
-            _translation_tts_worker = TranslationTTSWorkerSystem(_tts_engine)
-            await _translation_tts_worker.start()
+            translation_tts_worker = TranslationTTSWorkerSystem(
+                tts_engine,
+                tts_concurrency=config.voicevox.tts_concurrency,
+                tts_queue_max=config.voicevox.tts_queue_max,
+                audio_queue_max=config.voicevox.audio_queue_max
+            )
+            await translation_tts_worker.start()
             logger.info("  Translation+TTS workers started")
 
         except Exception as e:
-            logger.error(f"Failed to initialize Translation+TTS system: {e}", exc_info=True)
+            logger.error("Failed to initialize Translation+TTS system: %s", e, exc_info=True)
             logger.error("Please ensure VOICEVOX is running at http://localhost:50021")
             raise RuntimeError(
                 "Translation+TTS system initialization failed. "
@@ -104,9 +218,8 @@ async def lifespan(app: FastAPI):
             )
 
         # Store in app state for access from endpoints
-        app.state.config = _config
-        app.state.tts_engine = _tts_engine
-        app.state.translation_tts_worker = _translation_tts_worker
+        app.state.tts_engine = tts_engine
+        app.state.translation_tts_worker = translation_tts_worker
 
         logger.info("="*60)
         logger.info("Server Ready - VOICEVOX Translation+TTS Active")
@@ -115,7 +228,7 @@ async def lifespan(app: FastAPI):
         yield
 
     except Exception as e:
-        logger.error(f"Startup failed: {e}", exc_info=True)
+        logger.error("Startup failed: %s", e, exc_info=True)
         raise
 
     finally:
@@ -125,17 +238,27 @@ async def lifespan(app: FastAPI):
         logger.info("="*60)
 
         # Stop Translation+TTS workers first
-        if _translation_tts_worker:
+        app.state.translation_tts_worker = None
+        if translation_tts_worker:
             logger.info("Stopping Translation+TTS workers...")
-            await _translation_tts_worker.stop(timeout=10.0)
-            logger.info(f"Translation+TTS workers stopped. Stats: {_translation_tts_worker.stats}")
+            await translation_tts_worker.stop()
+            logger.info("Translation+TTS workers stopped. Stats: %s", translation_tts_worker.stats)
 
         # Cleanup VOICEVOX engine resources
-        if _tts_engine:
+        if tts_engine:
             logger.info("Cleaning up VOICEVOX engine...")
-            await _tts_engine.cleanup()
+            await tts_engine.cleanup()
             logger.info("VOICEVOX engine cleanup completed")
 
+        # Close pooled Ollama connections
+        try:
+            await close_translation_client()
+        except Exception as e:
+            logger.warning("Failed to close Ollama client: %s", e)
+
+        # Write out buffered translation log entries
+        await close_translation_logger()
+
         logger.info("="*60)
         logger.info("Server Shutdown Complete")
         logger.info("="*60)
@@ -151,32 +274,45 @@ app = FastAPI(
 
 
 @app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check(http_request: Request) -> HealthResponse:
     """
     Health check endpoint.
 
     Returns server status and Translation+TTS queue statistics.
+    The response is cached for HEALTH_CACHE_TTL, so rapid polls see the same snapshot.
 
     Returns:
         HealthResponse with current server state
     """
-    if not _translation_tts_worker:
+    state = http_request.app.state
+    translation_tts_worker = getattr(state, "translation_tts_worker", None)
+    if not translation_tts_worker:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Server not fully initialized"
         )
 
-    return HealthResponse(
+    now = time.monotonic()
+    cached_at, cached = getattr(state, "health_cache", (0.0, None))
+    if cached is not None and now - cached_at < HEALTH_CACHE_TTL:
+        return cached
+
+    response = HealthResponse(
         status="ok",
-        translation_queue_size=_translation_tts_worker.get_translation_queue_size(),
-        tts_queue_size=_translation_tts_worker.get_tts_queue_size(),
-        translation_stats=_translation_tts_worker.stats.get("translation", {}),
-        tts_stats=_translation_tts_worker.stats.get("tts", {})
+        translation_queue_size=translation_tts_worker.get_translation_queue_size(),
+        tts_queue_size=translation_tts_worker.get_tts_queue_size(),
+        translation_stats=translation_tts_worker.stats.get("translation", {}),
+        tts_stats=translation_tts_worker.stats.get("tts", {}),
+        dedup_stats=dict(state.deduplicator.stats),
+        translation_cache_stats=get_translation_cache_stats(),
+        warmup_ms=getattr(state, "warmup_ms", {})
     )
+    state.health_cache = (now, response)
+    return response
 
 
 @app.post("/translate_and_speak", response_model=TranslateAndSpeakResponse, status_code=status.HTTP_202_ACCEPTED)
-async def translate_and_speak(request: TranslateAndSpeakRequest) -> TranslateAndSpeakResponse:
+async def translate_and_speak(request: TranslateAndSpeakRequest, http_request: Request) -> TranslateAndSpeakResponse:
     """
     Translate English/Chinese text to Japanese and speak it using TTS.
 
@@ -191,6 +327,7 @@ async def translate_and_speak(request: TranslateAndSpeakRequest) -> TranslateAnd
 
     Args:
         request: TranslateAndSpeakRequest with text and return_audio flag
+        http_request: Incoming HTTP request (gives access to app.state)
 
     Returns:
         TranslateAndSpeakResponse with acceptance confirmation
@@ -199,46 +336,19 @@ async def translate_and_speak(request: TranslateAndSpeakRequest) -> TranslateAnd
         HTTPException 503: If Translation+TTS system not initialized
         HTTPException 422: If request validation fails (handled by FastAPI)
     """
-    if not _translation_tts_worker:
+    state = http_request.app.state
+    translation_tts_worker = getattr(state, "translation_tts_worker", None)
+    if not translation_tts_worker:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Translation+TTS system not initialized (check server logs for errors)"
         )
 
     # Deduplication: prevent concurrent hooks from sending duplicate requests
-    global _last_translation, _last_translation_time
-
-    try:
-        async def dedup_check():
-            global _last_translation, _last_translation_time
-            async with _dedup_lock:
-                current_time = time.time()
-
-                # Check if duplicate: same text AND within 1 second
-                is_duplicate = (
-                    request.text == _last_translation and
-                    _last_translation_time is not None and
-                    (current_time - _last_translation_time) <= 1.0
-                )
-
-                if not is_duplicate:
-                    _last_translation = request.text
-                    _last_translation_time = current_time
-
-                return is_duplicate
-
-        # Timeout to prevent deadlock (500ms is generous for simple check)
-        is_duplicate = await asyncio.wait_for(dedup_check(), timeout=0.5)
-
-    except asyncio.TimeoutError:
-        logger.warning(f"Failed to acquire dedup lock (timeout), rejecting request: {request.text[:50]}...")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Server busy (deduplication lock timeout)"
-        )
+    is_duplicate = state.deduplicator.is_duplicate(request.text)
 
     if is_duplicate:
-        logger.info(f"Skipping duplicate request: {request.text[:50]}...")
+        logger.info("Skipping duplicate request: %.50s...", request.text)
         return TranslateAndSpeakResponse(
             status="skipped",
             message="Duplicate request ignored",
@@ -246,24 +356,23 @@ async def translate_and_speak(request: TranslateAndSpeakRequest) -> TranslateAnd
         )
 
     # Generate unique request ID
-    import uuid
-    request_id = str(uuid.uuid4())[:8]
+    request_id = _next_request_id()
 
     # Log request
-    logger.info(f"[{request_id}] /translate_and_speak request: {request.text[:50]}...")
+    logger.info("[%s] /translate_and_speak request: %.50s...", request_id, request.text)
 
     # Enqueue for translation (background worker will handle rest)
     # Note: Worker will detect『』and skip translation if needed
-    await _translation_tts_worker.enqueue_translation(
+    await translation_tts_worker.enqueue_translation(
         text=request.text,
         request_id=request_id,
         return_audio=request.return_audio
     )
 
     # Get queue position for response
-    queue_position = _translation_tts_worker.get_translation_queue_size()
+    queue_position = translation_tts_worker.get_translation_queue_size()
 
-    logger.info(f"[{request_id}] Request queued (position: {queue_position})")
+    logger.info("[%s] Request queued (position: %d)", request_id, queue_position)
 
     return TranslateAndSpeakResponse(
         status="queued",
@@ -288,7 +397,7 @@ async def root():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -320,11 +429,12 @@ if __name__ == "__main__":
     # For development: run with uvicorn
     import uvicorn
 
+    config = build_config(load_config("config.yaml"))
     logger.info("Starting server in development mode")
     uvicorn.run(
         "server.app:app",
-        host="127.0.0.1",
-        port=8765,
+        host=config.server.host,
+        port=config.server.port,
         reload=True,
         log_level="info"
     )
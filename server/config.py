@@ -16,10 +16,16 @@ Configuration Structure:
     model_provider:
         type: Model provider (ollama/claude)
         ollama/claude: Provider-specific configuration
+    voicevox:
+        base_url, speaker_id, timeout: VOICEVOX Engine client settings
+        tts_concurrency: TTS requests the worker system keeps in flight
+        tts_queue_max, audio_queue_max: Worker system queue bounds
 """
 
 import os
+import re
 import yaml
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
@@ -47,10 +53,96 @@ DEFAULT_CONFIG = {
             "base_url": "http://localhost:11434",
             "timeout": 30
         }
+    },
+    "voicevox": {
+        "base_url": "http://localhost:50021",
+        "speaker_id": 14,
+        "timeout": 30.0,
+        "tts_concurrency": 1,
+        "tts_queue_max": 4,
+        "audio_queue_max": 4
     }
 }
 
 
+# ${VAR_NAME} references in config values (see resolve_env_vars)
+_ENV_RE = re.compile(r'\$\{([^}]+)\}')
+
+# Environment variable overrides: (env var, config key path, type), see load_config
+_ENV_OVERRIDES = (
+    ("SERVER_HOST", ("server", "host"), str),
+    ("SERVER_PORT", ("server", "port"), int),
+    ("AUDIO_DIR", ("audio_selector", "audio_dir"), str),
+    ("MODEL_PROVIDER", ("model_provider", "type"), str),
+    ("OLLAMA_MODEL", ("model_provider", "ollama", "model"), str),
+    ("OLLAMA_BASE_URL", ("model_provider", "ollama", "base_url"), str),
+)
+
+# Validation constants (built once, not per validate_config call)
+REQUIRED_SECTIONS = ("server", "audio_selector", "model_provider")
+VALID_PROVIDERS = ("ollama", "claude")
+
+
+@dataclass(slots=True, frozen=True)
+class ServerConfig:
+    """server section."""
+    host: str
+    port: int
+
+
+@dataclass(slots=True, frozen=True)
+class AudioSelectorConfig:
+    """audio_selector section."""
+    type: str
+    audio_dir: Path
+    min_interval: float
+    max_age_hours: float
+    max_size_mb: float
+
+
+@dataclass(slots=True, frozen=True)
+class OllamaConfig:
+    """model_provider.ollama section."""
+    model: str
+    base_url: str
+    timeout: float
+
+
+@dataclass(slots=True, frozen=True)
+class ClaudeConfig:
+    """model_provider.claude section."""
+    model: str
+    api_key: str
+
+
+@dataclass(slots=True, frozen=True)
+class ModelProviderConfig:
+    """model_provider section (only the selected provider's settings are required)."""
+    type: str
+    ollama: Optional[OllamaConfig] = None
+    claude: Optional[ClaudeConfig] = None
+
+
+@dataclass(slots=True, frozen=True)
+class VoicevoxConfig:
+    """voicevox section."""
+    base_url: str
+    speaker_id: int
+    timeout: float
+    tts_concurrency: int
+    tts_queue_max: int
+    audio_queue_max: int
+
+
+@dataclass(slots=True, frozen=True)
+class AppConfig:
+    """Read-only server configuration tree (see build_config)."""
+    server: ServerConfig
+    audio_selector: AudioSelectorConfig
+    model_provider: ModelProviderConfig
+    voicevox: VoicevoxConfig
+
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from YAML file with environment variable overrides.
@@ -106,6 +198,62 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     return config
 
 
+def build_config(config: Dict[str, Any]) -> AppConfig:
+    """
+    Convert a configuration dictionary (from load_config) into an AppConfig.
+
+    Built once at startup: consumers then use attribute access instead of
+    nested string-keyed lookups, and the frozen tree can't be modified by accident.
+
+    Args:
+        config: Validated configuration dictionary
+
+    Returns:
+        AppConfig tree
+    """
+    defaults = DEFAULT_CONFIG["audio_selector"]
+    server = config["server"]
+    audio = config["audio_selector"]
+    model = config["model_provider"]
+
+    ollama = model.get("ollama")
+    claude = model.get("claude")
+    ollama_defaults = DEFAULT_CONFIG["model_provider"]["ollama"]
+    voicevox = config.get("voicevox", {})
+    voicevox_defaults = DEFAULT_CONFIG["voicevox"]
+
+    return AppConfig(
+        server=ServerConfig(host=server["host"], port=server["port"]),
+        audio_selector=AudioSelectorConfig(
+            type=audio.get("type", defaults["type"]),
+            audio_dir=Path(audio.get("audio_dir", defaults["audio_dir"])),
+            min_interval=audio.get("min_interval", defaults["min_interval"]),
+            max_age_hours=audio.get("max_age_hours", defaults["max_age_hours"]),
+            max_size_mb=audio.get("max_size_mb", defaults["max_size_mb"]),
+        ),
+        model_provider=ModelProviderConfig(
+            type=model["type"],
+            ollama=OllamaConfig(
+                model=ollama["model"],
+                base_url=ollama.get("base_url", ollama_defaults["base_url"]),
+                timeout=ollama.get("timeout", ollama_defaults["timeout"]),
+            ) if ollama and "model" in ollama else None,
+            claude=ClaudeConfig(
+                model=claude["model"],
+                api_key=claude["api_key"],
+            ) if claude and "model" in claude and "api_key" in claude else None,
+        ),
+        voicevox=VoicevoxConfig(
+            base_url=voicevox.get("base_url", voicevox_defaults["base_url"]),
+            speaker_id=voicevox.get("speaker_id", voicevox_defaults["speaker_id"]),
+            timeout=voicevox.get("timeout", voicevox_defaults["timeout"]),
+            tts_concurrency=voicevox.get("tts_concurrency", voicevox_defaults["tts_concurrency"]),
+            tts_queue_max=voicevox.get("tts_queue_max", voicevox_defaults["tts_queue_max"]),
+            audio_queue_max=voicevox.get("audio_queue_max", voicevox_defaults["audio_queue_max"]),
+        ),
+    )
+
+
 def validate_config(config: Dict[str, Any]) -> None:
     """
     Validate configuration structure and values.
@@ -117,8 +265,7 @@ def validate_config(config: Dict[str, Any]) -> None:
         ValueError: If configuration is invalid
     """
     # Validate required top-level keys
-    required_keys = ["server", "audio_selector", "model_provider"]
-    for key in required_keys:
+    for key in REQUIRED_SECTIONS:
         if key not in config:
             raise ValueError(f"Missing required configuration section: {key}")
 
@@ -139,13 +286,12 @@ def validate_config(config: Dict[str, Any]) -> None:
 
     # Validate model provider
     model_config = config["model_provider"]
-    valid_providers = ["ollama", "claude"]
     provider_type = model_config.get("type")
 
-    if provider_type not in valid_providers:
+    if provider_type not in VALID_PROVIDERS:
         raise ValueError(
             f"Invalid model provider: {provider_type}. "
-            f"Must be one of: {valid_providers}"
+            f"Must be one of: {list(VALID_PROVIDERS)}"
         )
 
     # Validate provider-specific configuration
@@ -207,17 +353,12 @@ def resolve_env_vars(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Configuration with environment variables resolved
     """
-    import re
-
     def resolve_value(value):
         if isinstance(value, str):
-            # Find ${VAR} patterns and replace with env var values
-            pattern = r'\$\{([^}]+)\}'
-            matches = re.findall(pattern, value)
-            for var_name in matches:
-                env_value = os.getenv(var_name, '')
-                value = value.replace(f'${{{var_name}}}', env_value)
-            return value
+            # Replace ${VAR} patterns with env var values in a single pass
+            if '$' not in value:
+                return value
+            return _ENV_RE.sub(lambda m: os.getenv(m.group(1), ''), value)
         elif isinstance(value, dict):
             return {k: resolve_value(v) for k, v in value.items()}
         elif isinstance(value, list):
@@ -232,8 +373,21 @@ def resolve_env_vars(config: Dict[str, Any]) -> Dict[str, Any]:
 
 def _deep_copy_dict(d: Dict[str, Any]) -> Dict[str, Any]:
     """Deep copy a dictionary."""
-    import copy
-    return copy.deepcopy(d)
+    return {key: _clone_value(value) for key, value in d.items()}
+
+
+def _clone_value(value: Any) -> Any:
+    """
+    Copy a config value: dicts and lists are copied recursively, scalars are shared.
+
+    Config trees only hold dicts, lists and immutable YAML scalars, so this
+    replaces copy.deepcopy() without its memo dict and generic type dispatch.
+    """
+    if isinstance(value, dict):
+        return {key: _clone_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_value(item) for item in value]
+    return value
 
 
 def _deep_merge_dicts(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
@@ -268,33 +422,22 @@ def _apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Configuration with environment variable overrides applied
     """
-    # Server overrides
-    if "SERVER_HOST" in os.environ:
-        config["server"]["host"] = os.environ["SERVER_HOST"]
-
-    if "SERVER_PORT" in os.environ:
+    environ = os.environ
+    for env_key, path, cast in _ENV_OVERRIDES:
+        raw = environ.get(env_key)
+        if raw is None:
+            continue
         try:
-            config["server"]["port"] = int(os.environ["SERVER_PORT"])
+            value = cast(raw)
         except ValueError:
-            logger.warning(f"Invalid SERVER_PORT value: {os.environ['SERVER_PORT']}")
-
-    # Audio selector overrides
-    if "AUDIO_DIR" in os.environ:
-        config["audio_selector"]["audio_dir"] = os.environ["AUDIO_DIR"]
-
-    # Model provider overrides
-    if "MODEL_PROVIDER" in os.environ:
-        config["model_provider"]["type"] = os.environ["MODEL_PROVIDER"]
-
-    if "OLLAMA_MODEL" in os.environ:
-        if "ollama" not in config["model_provider"]:
-            config["model_provider"]["ollama"] = {}
-        config["model_provider"]["ollama"]["model"] = os.environ["OLLAMA_MODEL"]
-
-    if "OLLAMA_BASE_URL" in os.environ:
-        if "ollama" not in config["model_provider"]:
-            config["model_provider"]["ollama"] = {}
-        config["model_provider"]["ollama"]["base_url"] = os.environ["OLLAMA_BASE_URL"]
+            logger.warning(f"Invalid {env_key} value: {raw}")
+            continue
+
+        # Walk to the parent section, creating missing sections on the way
+        section = config
+        for key in path[:-1]:
+            section = section.setdefault(key, {})
+        section[path[-1]] = value
 
     return config
 
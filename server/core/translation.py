@@ -4,9 +4,13 @@ Translation utilities for server integration.
 Provides translate_to_japanese() function using Ollama for English/Mandarin to Japanese translation.
 """
 
+import asyncio
+import hashlib
 import os
 import re
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Optional, Union
 
 try:
     import ollama  # type: ignore
@@ -14,18 +18,192 @@ except Exception:
     ollama = None
 
 
+# Fast-path detection: kana means the text is Japanese (Chinese has no kana),
+# Latin letters mean there is still English left for the model to translate
+_KANA_RE = re.compile(r'[ぁ-ゖァ-ヶ]')
+_LATIN_RE = re.compile(r'[A-Za-z]')
+
+# postprocess_for_tts() patterns, compiled once (numbers match the steps there)
+_RE_EXPLANATION = re.compile(r'Explanation:.*', re.IGNORECASE | re.DOTALL)  # 0
+
+# Steps 1-7 in a single pass: one alternative per rewrite, dispatched on lastgroup
+_RE_TTS_TOKEN = re.compile(
+    r'(?P<fraction>(?P<numerator>\d+)/(?P<denominator>\d+))'  # 1
+    r'|(?P<decimal>(?<=\d)\.(?=\d))'  # 2
+    r'|(?P<wave_dash>(?<=\d)～(?=\d))'  # 3
+    r'|(?P<percent>(?<=\d)[％%])'  # 4
+    r'|(?P<separator>[._-])'  # 5-6
+    r'|(?P<acronym>[A-Z]{4,})'  # 7
+)
+_TTS_TOKEN_TEXT = {'decimal': 'てん', 'wave_dash': 'から', 'percent': 'パーセント', 'separator': ' '}
+
+# Steps 8-9 in a single pass: drop whitespace between the character pairs listed there
+_RE_MERGE_SPACES = re.compile(
+    r'(?<=[A-Za-z0-9])\s+(?=[ぁ-ゖァ-ヶ\u4E00-\u9FFF])'  # 8
+    r'|(?<=[ぁ-ゖァ-ヶ\u4E00-\u9FFF])\s+(?=[A-Za-z0-9])'  # 8
+    r'|(?<=[A-Za-z])\s+(?=\d)'  # 9
+    r'|(?<=\d)\s+(?=[A-Za-z])'  # 9
+)
+
+# Fixed instruction sent before every source text (built once, byte-identical
+# across calls so Ollama can reuse the cached prompt prefix)
+_PROMPT_PREFIX = (
+    "あなたはラジオ番組で技術内容を解説する専門家で、時間制約のため一息で伝わる簡潔な一文にまとめて説明する必要があります。"
+    "次のテキストを自然で簡潔な日本語に翻訳してください。"
+    "背景と判断を軽く示したうえで、結論を落ち着いた丁寧調で述べ、余計な説明は時間の都合で省く必要があります。\n"
+    "テキスト：\n\n"
+)
+
+# Decoding stops as soon as the model starts an explanation, which
+# postprocess_for_tts() would strip anyway (stop strings are case-sensitive)
+_STOP_SEQUENCES = ["Explanation:", "explanation:", "EXPLANATION:"]
+
+# Translation cache: repeated hook texts skip the model call entirely
+TRANSLATION_CACHE_SIZE = 256
+TRANSLATION_CACHE_TTL = 3600.0  # seconds
+
+# Upper bound for the startup model load: a cold load takes seconds, not minutes
+WARMUP_TIMEOUT = 60.0  # seconds
+_translation_cache: "OrderedDict[bytes, tuple[str, float]]" = OrderedDict()
+_translation_cache_stats = {"hits": 0, "misses": 0}
+
+# Shared Ollama client: keeps HTTP connections to Ollama alive between requests
+_client = None
+_client_key: Optional[tuple] = None
+
+
 def _env(key: str, default: Optional[str] = None) -> str:
     """Get environment variable with optional default."""
     v = os.environ.get(key)
     return v if v is not None else (default or "")
 
 
+def _base_url() -> str:
+    """Get Ollama base URL (OLLAMA_BASE_URL) and export it as OLLAMA_HOST."""
+    base = _env("OLLAMA_BASE_URL", "http://localhost:11434").rstrip("/")
+    os.environ.setdefault("OLLAMA_HOST", base)
+    return base
+
+
+def _model_name() -> str:
+    """Get translation model name (OLLAMA_MODEL)."""
+    return os.environ.get("OLLAMA_MODEL", "my-translator")
+
+
+def _keep_alive() -> Union[float, str]:
+    """Get how long Ollama should keep the model loaded after a request.
+
+    Reads OLLAMA_KEEP_ALIVE (same variable `ollama serve` uses). Plain numbers
+    are seconds (-1 = keep loaded forever); duration strings like "30m" are
+    passed through as-is.
+    """
+    value = _env("OLLAMA_KEEP_ALIVE", "-1").strip()
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _request_timeout() -> float:
+    """Get the per-request Ollama timeout in seconds (OLLAMA_TIMEOUT, default 15).
+
+    A warm model answers in well under a second, so a request that runs this
+    long means Ollama is hung or reloading; give up instead of stalling the queue.
+    """
+    try:
+        return float(_env("OLLAMA_TIMEOUT", "15"))
+    except ValueError:
+        return 15.0
+
+
+def _max_output_tokens(source_text: str) -> int:
+    """Upper bound on tokens the model may generate for a translation.
+
+    Output longer than 2x the source is rejected by is_valid_japanese_translation()
+    anyway, so stop decoding there instead of letting a runaway generation finish.
+    """
+    return max(64, len(source_text) * 2)
+
+
+def _cache_key(source_text: str) -> bytes:
+    """Hash whitespace-normalized source text into a translation cache key."""
+    normalized = " ".join(source_text.split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+def _cache_get(key: bytes) -> Optional[str]:
+    """Get cached translation, dropping it if older than TRANSLATION_CACHE_TTL."""
+    entry = _translation_cache.get(key)
+    if entry is None:
+        _translation_cache_stats["misses"] += 1
+        return None
+
+    japanese_text, stored_at = entry
+    if time.monotonic() - stored_at > TRANSLATION_CACHE_TTL:
+        del _translation_cache[key]
+        _translation_cache_stats["misses"] += 1
+        return None
+
+    _translation_cache.move_to_end(key)
+    _translation_cache_stats["hits"] += 1
+    return japanese_text
+
+
+def _cache_put(key: bytes, japanese_text: str) -> None:
+    """Store translation, evicting least recently used entries over TRANSLATION_CACHE_SIZE."""
+    _translation_cache[key] = (japanese_text, time.monotonic())
+    _translation_cache.move_to_end(key)
+    while len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+        _translation_cache.popitem(last=False)
+
+
+def get_translation_cache_stats() -> dict:
+    """Get translation cache hits, misses, hit ratio and current size."""
+    hits = _translation_cache_stats["hits"]
+    lookups = hits + _translation_cache_stats["misses"]
+    return {
+        **_translation_cache_stats,
+        "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+        "size": len(_translation_cache),
+    }
+
+
 def _require_ollama():
     """Check if ollama package is installed."""
     if ollama is None:
         raise RuntimeError("python package 'ollama' not installed; run: pip install ollama")
 
 
+def _get_client():
+    """Get the shared Ollama AsyncClient, creating it on first use.
+
+    The client (and its connection pool) is rebuilt if OLLAMA_BASE_URL changes
+    or it is used from a different event loop, since pooled connections are
+    bound to the loop that opened them.
+    """
+    global _client, _client_key
+    key = (_base_url(), asyncio.get_running_loop())
+    if _client is None or _client_key != key:
+        _client = ollama.AsyncClient(host=key[0])
+        _client_key = key
+    return _client
+
+
+async def close_translation_client() -> None:
+    """Close the shared Ollama client and its pooled connections (server shutdown)."""
+    global _client, _client_key
+    client, _client, _client_key = _client, None, None
+    if client is None:
+        return
+    # AsyncClient.close() only exists in newer ollama releases; older ones are
+    # closed through their underlying httpx.AsyncClient, if it is still there
+    close = getattr(client, "close", None)
+    if close is None:
+        close = getattr(getattr(client, "_client", None), "aclose", None)
+    if close is not None:
+        await close()
+
+
 def is_valid_japanese_translation(text: str, source_text: str) -> bool:
     """Check if translation is valid (not a model crash/hallucination).
 
@@ -48,6 +226,36 @@ def is_valid_japanese_translation(text: str, source_text: str) -> bool:
     return ascii_count / len(text) < 0.5
 
 
+def is_already_japanese(text: str) -> bool:
+    """Check if text is already Japanese and needs no model call.
+
+    Args:
+        text: Source text
+
+    Returns:
+        True if text contains kana and no Latin letters
+    """
+    return _KANA_RE.search(text) is not None and _LATIN_RE.search(text) is None
+
+
+def _replace_tts_token(match: "re.Match[str]") -> str:
+    """Rewrite one postprocess_for_tts() step 1-7 match for TTS.
+
+    1. Fractions: "1/2" → "1分の2" (bunno)
+    2. Decimal points between digits: "3.2" → "3てん2" (ten)
+    3. Wave dash between digits: "1～10" → "1から10" (kara)
+    4. Percent after digits: "50%" / "50％" → "50パーセント" (paasento)
+    5-6. Other periods, hyphens, underscores: "my-translator" → "my translator"
+    7. Uppercase acronyms (4+ letters): "HTTP" → "Http", "USA" stays "USA"
+    """
+    kind = match.lastgroup
+    if kind == 'fraction':
+        return match.group('numerator') + '分の' + match.group('denominator')
+    if kind == 'acronym':
+        return match.group().capitalize()
+    return _TTS_TOKEN_TEXT[kind]
+
+
 def postprocess_for_tts(text: str) -> str:
     """Post-process translated Japanese text for better TTS pronunciation.
 
@@ -72,50 +280,37 @@ def postprocess_for_tts(text: str) -> str:
     # 0. Remove unwanted explanations from the model
     # Sometimes the model adds explanations like "Explanation: ..." which we don't want in TTS
     # This removes "Explanation:" and everything after it (case-insensitive)
-    text = re.sub(r'Explanation:.*', '', text, flags=re.IGNORECASE | re.DOTALL)
+    text = _RE_EXPLANATION.sub('', text)
     text = text.strip()
 
-    # 1. Replace fractions with Japanese "分の" (bunno/fraction)
-    # Matches patterns like "1/2", "3/4", "10/100", etc.
-    text = re.sub(r'(\d+)/(\d+)', r'\1分の\2', text)
-
-    # 2. Replace decimal points between digits with Japanese "てん" (ten/point)
-    # Uses lookahead/lookbehind to match periods between digits: "1.2.3" → "1てん2てん3"
-    text = re.sub(r'(?<=\d)\.(?=\d)', 'てん', text)
+    # 1-7. Numbers, separators and acronyms (see _replace_tts_token)
+    # None of these rewrites changes what a later one matches, so one pass
+    # over the text gives the same result as running them in order
+    text = _RE_TTS_TOKEN.sub(_replace_tts_token, text)
 
-    # 3. Replace wave dash between digits with Japanese "から" (kara/from-to)
-    # Matches patterns like "1～10", "50～100" for number ranges
-    text = re.sub(r'(?<=\d)～(?=\d)', 'から', text)
+    # 8-9. Remove spaces between English/numbers and Japanese, and between
+    # English and numbers, for smoother reading: "API 設定" → "API設定", "python 3" → "python3"
+    text = _RE_MERGE_SPACES.sub('', text)
 
-    # 4. Replace percent signs with Japanese "パーセント" (paasento/percent)
-    # Matches both full-width "％" and half-width "%" after digits: "50%" → "50パーセント"
-    text = re.sub(r'(?<=\d)[％%]', 'パーセント', text)
-
-    # 5. Replace remaining periods with spaces (e.g., filenames, abbreviations)
-    text = text.replace('.', ' ')
-
-    # 6. Replace hyphens and underscores with spaces in technical terms
-    # This helps TTS pronounce "my-translator" as "my translator" instead of awkward pauses
-    text = text.replace('-', ' ')
-    text = text.replace('_', ' ')
+    return text
 
-    # 7. Convert long uppercase acronyms (4+ letters) to capitalized form
-    # Examples: "HTTP" → "Http", "HTTPS" → "Https", but "USA" stays "USA"
-    text = re.sub(r'[A-Z]{4,}', lambda m: m.group(0).capitalize(), text)
 
-    # 8. Remove spaces between English/numbers and Japanese for smoother reading
-    # English/numbers + space + Japanese → merge
-    text = re.sub(r'([A-Za-z0-9])\s+([ぁ-ゖァ-ヶ\u4E00-\u9FFF])', r'\1\2', text)
-    # Japanese + space + English/numbers → merge
-    text = re.sub(r'([ぁ-ゖァ-ヶ\u4E00-\u9FFF])\s+([A-Za-z0-9])', r'\1\2', text)
+async def warmup_translation_model() -> None:
+    """Load the translation model into Ollama ahead of the first request.
 
-    # 9. Remove spaces between English and numbers for smoother reading
-    # English + space + number → merge
-    text = re.sub(r'([A-Za-z])\s+(\d)', r'\1\2', text)
-    # Number + space + English → merge
-    text = re.sub(r'(\d)\s+([A-Za-z])', r'\1\2', text)
+    A generate request without a prompt makes Ollama load the model
+    (honoring keep_alive) without generating any tokens.
 
-    return text
+    Raises:
+        RuntimeError: If ollama is not installed
+        asyncio.TimeoutError: If the model isn't loaded within WARMUP_TIMEOUT
+        Exception: If Ollama is unreachable or the model is missing
+    """
+    _require_ollama()
+    await asyncio.wait_for(
+        _get_client().generate(model=_model_name(), keep_alive=_keep_alive()),
+        timeout=WARMUP_TIMEOUT
+    )
 
 
 async def translate_to_japanese(text: str) -> str:
@@ -134,26 +329,39 @@ async def translate_to_japanese(text: str) -> str:
 
     Raises:
         ValueError: If text is empty or translation is invalid (model crash)
+        asyncio.TimeoutError: If Ollama does not answer within OLLAMA_TIMEOUT
         RuntimeError: If translation fails
     """
     source_text = (text or "").strip()
     if not source_text:
         raise ValueError("text is required")
 
-    base = _env("OLLAMA_BASE_URL", "http://localhost:11434").rstrip("/")
-    os.environ.setdefault("OLLAMA_HOST", base)
+    # Fast path: nothing to translate, skip the model round-trip entirely
+    if is_already_japanese(source_text):
+        return postprocess_for_tts(source_text)
+
+    cache_key = _cache_key(source_text)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
 
     _require_ollama()
 
     # Use custom my-translator model (qwen3:4b-instruct with optimized SYSTEM prompt)
     # The model is pre-configured to produce concise Japanese summaries
     try:
-        # Use AsyncClient for non-blocking HTTP calls
-        model_name = os.environ.get("OLLAMA_MODEL", "my-translator")
-        client = ollama.AsyncClient(host=base)
-        response = await client.chat(
-            model=model_name,
-            messages=[{"role": "user", "content": f"あなたはラジオ番組で技術内容を解説する専門家で、時間制約のため一息で伝わる簡潔な一文にまとめて説明する必要があります。次のテキストを自然で簡潔な日本語に翻訳してください。背景と判断を軽く示したうえで、結論を落ち着いた丁寧調で述べ、余計な説明は時間の都合で省く必要があります。\nテキスト：\n\n{source_text}"}]
+        # Shared AsyncClient: non-blocking HTTP over a reused keep-alive connection
+        response = await asyncio.wait_for(
+            _get_client().chat(
+                model=_model_name(),
+                keep_alive=_keep_alive(),
+                options={
+                    "num_predict": _max_output_tokens(source_text),
+                    "stop": _STOP_SEQUENCES
+                },
+                messages=[{"role": "user", "content": _PROMPT_PREFIX + source_text}]
+            ),
+            timeout=_request_timeout()
         )
         japanese_text = response["message"]["content"].strip()
 
@@ -172,6 +380,9 @@ async def translate_to_japanese(text: str) -> str:
         # Apply post-processing for better TTS pronunciation
         japanese_text = postprocess_for_tts(japanese_text)
 
+        _cache_put(cache_key, japanese_text)
         return japanese_text
+    except asyncio.TimeoutError:
+        raise
     except Exception as e:
         raise RuntimeError(f"translation failed: {e}")
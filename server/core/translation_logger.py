@@ -3,62 +3,218 @@ Translation logging utility for quality analysis.
 
 Records all Ollama translation calls in JSONL format for later LLM analysis.
 Designed to be non-intrusive - logging failures never disrupt translation pipeline.
+
+Entries are queued in memory and written by a single background flusher task,
+which batches queued lines into one write on a long-lived file handle.
 """
 
 import asyncio
 import json
 import logging
 import os
-import subprocess
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+
+    def _jsonl_line(entry: dict) -> bytes:
+        # UTF-8 bytes straight from C, no ensure_ascii scan or separate encode
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    def _jsonl_line(entry: dict) -> bytes:
+        return (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
 logger = logging.getLogger(__name__)
 
-# Cache git hash at module initialization (avoid repeated subprocess calls)
+# Resolved once at import: repo root (for git) and the JSONL log directory
+_REPO_ROOT = Path(__file__).parent.parent.parent
+_LOGS_DIR = _REPO_ROOT / "logs"
+
+# Ollama model name recorded with each entry (OLLAMA_MODEL is read once, at import)
+_MODELFILE_NAME = os.environ.get("OLLAMA_MODEL", "my-translator")
+
+# Today's log file path, rebuilt (and logs/ created) only when the date changes
+_cached_log_date: Optional[date] = None
+_cached_log_path: Optional[Path] = None
+
+# Cache git hash at first use (HEAD is read once per process)
 _cached_git_hash: Optional[str] = None
 
+# Buffered writer: log_translation() only enqueues, _flusher() does the file I/O
+LOG_QUEUE_SIZE = 1024  # Entries beyond this are dropped (with a warning)
+LOG_BATCH_MAX = 256  # Lines joined into a single write
+_log_queue: Optional[asyncio.Queue] = None
+_flusher_task: Optional[asyncio.Task] = None
+_flusher_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Append handle kept open between writes (only touched from the flusher's executor calls)
+_log_handle = None
+_log_handle_path: Optional[Path] = None
+
+
+def _read_git_hash(repo_root: Path) -> str:
+    """
+    Resolve HEAD to a commit hash by reading git's files directly (no git subprocess).
+
+    Handles detached HEAD, loose and packed refs, and worktrees/submodules whose
+    .git is a "gitdir: ..." pointer file.
+
+    Raises:
+        OSError: If the repository files can't be read
+        ValueError: If HEAD points to a ref that doesn't exist
+    """
+    git_dir = repo_root / ".git"
+    if git_dir.is_file():
+        git_dir = (repo_root / git_dir.read_text(encoding="utf-8").strip().removeprefix("gitdir: ")).resolve()
+
+    head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    if not head.startswith("ref: "):
+        return head  # Detached HEAD holds the hash itself
+    ref = head[len("ref: "):]
+
+    # Linked worktrees keep refs in the main repository's git dir
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        common_dir = (git_dir / commondir_file.read_text(encoding="utf-8").strip()).resolve()
+
+    try:
+        return (common_dir / ref).read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        pass
+
+    # Ref was packed by git gc: "<hash> <ref>" lines
+    suffix = " " + ref
+    with open(common_dir / "packed-refs", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line.endswith(suffix):
+                return line[:-len(suffix)]
+    raise ValueError(f"ref not found: {ref}")
+
 
 def _get_git_hash() -> str:
     """Get current git commit hash (cached at first call)."""
     global _cached_git_hash
     if _cached_git_hash is None:
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=Path(__file__).parent.parent.parent,  # repo root
-                capture_output=True,
-                text=True,
-                timeout=2.0
-            )
-            if result.returncode == 0:
-                _cached_git_hash = result.stdout.strip()
-            else:
-                _cached_git_hash = "unknown"
+            _cached_git_hash = _read_git_hash(_REPO_ROOT)
         except Exception as e:
             logger.debug(f"Failed to get git hash: {e}")
             _cached_git_hash = "unknown"
     return _cached_git_hash
 
 
-def _get_modelfile_name() -> str:
-    """Get Ollama model name from environment variable."""
-    return os.environ.get("OLLAMA_MODEL", "my-translator")
+def initialize_translation_logger() -> None:
+    """
+    Resolve the git hash and today's log path (creating logs/) ahead of time.
+
+    Called once at server startup (from a worker thread), so the first
+    translation doesn't do this blocking file I/O on the event loop.
+    """
+    _get_git_hash()
+    _get_log_file_path()
 
 
 def _get_log_file_path() -> Path:
     """Get today's log file path: logs/translation_YYYY-MM-DD.jsonl"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    logs_dir = Path(__file__).parent.parent.parent / "logs"
-    logs_dir.mkdir(exist_ok=True)
-    return logs_dir / f"translation_{today}.jsonl"
+    global _cached_log_date, _cached_log_path
+    today = date.today()
+    if today != _cached_log_date:
+        _LOGS_DIR.mkdir(exist_ok=True)
+        _cached_log_path = _LOGS_DIR / f"translation_{today:%Y-%m-%d}.jsonl"
+        _cached_log_date = today
+    return _cached_log_path
 
 
-def _append_to_file(file_path: Path, content: str) -> None:
-    """Synchronous file append operation (called from executor)."""
-    with open(file_path, 'a', encoding='utf-8') as f:
-        f.write(content)
+def _append_to_file(content: bytes) -> Path:
+    """
+    Append to today's log file, reopening the handle when the date changes (called from executor).
+
+    The path is resolved here rather than by the caller, since a new day's path
+    means a mkdir that must not run on the event loop.
+
+    Returns:
+        Path of the log file written to
+    """
+    global _log_handle, _log_handle_path
+    file_path = _get_log_file_path()
+    if _log_handle_path != file_path:
+        _close_log_handle()
+        _log_handle = open(file_path, 'ab')
+        _log_handle_path = file_path
+    _log_handle.write(content)
+    _log_handle.flush()
+    return file_path
+
+
+def _close_log_handle() -> None:
+    """Close the long-lived log file handle, if open."""
+    global _log_handle, _log_handle_path
+    if _log_handle is not None:
+        _log_handle.close()
+    _log_handle = None
+    _log_handle_path = None
+
+
+async def _flusher(queue: asyncio.Queue) -> None:
+    """Background task: write queued log lines in batches."""
+    loop = asyncio.get_running_loop()
+    while True:
+        lines = [await queue.get()]
+        while len(lines) < LOG_BATCH_MAX and not queue.empty():
+            lines.append(queue.get_nowait())
+
+        try:
+            # Path is resolved per batch, so the first batch after midnight goes to the new day's file
+            log_file = await loop.run_in_executor(None, _append_to_file, b"".join(lines))
+            logger.debug("%d translation(s) logged to %s", len(lines), log_file)
+        except Exception as e:
+            # CRITICAL: Never let logging failures break translation
+            logger.warning(f"Failed to write translation log: {e}")
+        finally:
+            for _ in lines:
+                queue.task_done()
+
+
+def _get_log_queue() -> asyncio.Queue:
+    """Get the log queue, starting the flusher task on first use in this event loop."""
+    global _log_queue, _flusher_task, _flusher_loop
+    loop = asyncio.get_running_loop()
+    if _flusher_loop is not loop or _flusher_task is None or _flusher_task.done():
+        _log_queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+        _flusher_task = loop.create_task(_flusher(_log_queue))
+        _flusher_loop = loop
+    return _log_queue
+
+
+async def close_translation_logger(timeout: float = 5.0) -> None:
+    """
+    Write out queued log entries, stop the flusher and close the log file.
+
+    Called on server shutdown. Entries still queued after timeout are dropped.
+    """
+    global _log_queue, _flusher_task, _flusher_loop
+    queue, task = _log_queue, _flusher_task
+    _log_queue = _flusher_task = _flusher_loop = None
+
+    if task is not None and not task.done():
+        try:
+            await asyncio.wait_for(queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Translation log flush timed out, {queue.qsize()} entries dropped")
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    try:
+        _close_log_handle()
+    except Exception as e:
+        logger.warning(f"Failed to close translation log: {e}")
 
 
 async def log_translation(source_text: str, translated_text: str) -> None:
@@ -69,9 +225,12 @@ async def log_translation(source_text: str, translated_text: str) -> None:
     - source_text: Original input text
     - translated_text: Raw translation BEFORE post-processing
     - timestamp: ISO 8601 format, second precision
-    - modelfile: Ollama model name (from OLLAMA_MODEL env var)
+    - modelfile: Ollama model name (from OLLAMA_MODEL env var, read at import)
     - git_hash: Current git commit hash
 
+    The entry is queued and written by the background flusher, so this returns
+    without waiting for file I/O.
+
     Args:
         source_text: Original text before translation
         translated_text: Raw translated text (BEFORE postprocess_for_tts)
@@ -81,29 +240,24 @@ async def log_translation(source_text: str, translated_text: str) -> None:
         to prevent disrupting the translation pipeline.
     """
     try:
+        git_hash = _cached_git_hash
+        if git_hash is None:
+            # Not initialized at startup: resolve once off the event loop
+            git_hash = await asyncio.to_thread(_get_git_hash)
+
         # Prepare log entry
         entry = {
             "source_text": source_text,
             "translated_text": translated_text,
             "timestamp": datetime.now().isoformat(timespec='seconds'),  # 2025-12-15T14:30:45
-            "modelfile": _get_modelfile_name(),
-            "git_hash": _get_git_hash()
+            "modelfile": _MODELFILE_NAME,
+            "git_hash": git_hash
         }
 
-        # Write to log file (async I/O)
-        log_file = _get_log_file_path()
-        json_line = json.dumps(entry, ensure_ascii=False) + "\n"
-
-        # Use asyncio file I/O to avoid blocking
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            _append_to_file,
-            log_file,
-            json_line
-        )
+        _get_log_queue().put_nowait(_jsonl_line(entry))
 
-        logger.debug(f"Translation logged to {log_file}")
+    except asyncio.QueueFull:
+        logger.warning("Translation log queue full, entry dropped")
 
     except Exception as e:
         # CRITICAL: Never let logging failures break translation
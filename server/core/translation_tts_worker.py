@@ -18,10 +18,11 @@ Benefits:
 
 import asyncio
 import logging
-import subprocess
+import os
+import shutil
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Any
 from dataclasses import dataclass
 
 from server.core.translation import translate_to_japanese
@@ -29,7 +30,96 @@ from server.core.translation import translate_to_japanese
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Audio player for this platform (chosen once at import)
+# Windows plays in-process via winsound, avoiding a PowerShell/.NET startup per clip
+_USE_WINSOUND = sys.platform == "win32"
+
+if _USE_WINSOUND:
+    import winsound
+
+    def _play_wav_blocking(audio_path: Path) -> None:
+        winsound.PlaySound(str(audio_path), winsound.SND_FILENAME | winsound.SND_NODEFAULT)
+else:
+    # Absolute player path lets subprocess launch it with posix_spawn instead of fork+exec
+    _PLAYER = "afplay" if sys.platform == "darwin" else "aplay"
+    _PLAYER = shutil.which(_PLAYER) or _PLAYER
+
+    def _player_command(audio_path: Path) -> list[str]:
+        return [_PLAYER, str(audio_path)]
+
+
+def _ollama_num_parallel() -> int:
+    """
+    Requests the Ollama server handles at once (OLLAMA_NUM_PARALLEL, default 1).
+
+    Translations beyond this would queue inside Ollama with their timeout
+    already running, so the translation worker never sends more than this.
+    """
+    try:
+        return max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "1")))
+    except ValueError:
+        return 1
+
+
+async def drain(queue: asyncio.Queue, max_items: int) -> list:
+    """
+    Wait for one item, then take whatever else is already queued (up to max_items).
+
+    Only the first item involves an awaited get (and its waiter Future); the rest
+    are taken synchronously, so a burst of requests costs a single wakeup.
+    """
+    items = [await queue.get()]
+    while len(items) < max_items and not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+class AdjustableSemaphore:
+    """
+    Semaphore whose limit can be changed while tasks hold or wait for it.
+
+    An explicit in-use counter guarded by an asyncio.Condition, so resizing never
+    touches asyncio.Semaphore internals. Raising the limit wakes waiters at once;
+    lowering it lets current holders finish and blocks new acquires until the
+    count drops below the new limit.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = max(1, limit)
+        self._in_use = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_use < self._limit)
+            self._in_use += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._in_use -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        async with self._cond:
+            self._limit = max(1, limit)
+            self._cond.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+
+
+@dataclass(slots=True, frozen=True)
 class TranslationRequest:
     """Request to translate text."""
     text: str
@@ -37,7 +127,7 @@ class TranslationRequest:
     return_audio: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TTSRequest:
     """Request to synthesize audio."""
     japanese_text: str
@@ -45,7 +135,7 @@ class TTSRequest:
     return_audio: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioPlayRequest:
     """Request to play audio file."""
     audio_path: Path
@@ -68,34 +158,56 @@ class TranslationTTSWorkerSystem:
     - audio_play_worker: Plays audio and deletes temporary files
     """
 
-    def __init__(self, tts_engine: Any):
+    def __init__(
+        self,
+        tts_engine: Any,
+        translation_concurrency: Optional[int] = None,
+        tts_concurrency: int = 1,
+        tts_queue_max: int = 4,
+        audio_queue_max: int = 4
+    ):
         """
         Initialize the translation+TTS worker system.
 
         Args:
             tts_engine: TTS engine instance (VoicevoxEngine)
+            translation_concurrency: Max translations in flight (default: OLLAMA_NUM_PARALLEL)
+            tts_concurrency: Max TTS requests in flight (voicevox.tts_concurrency)
+            tts_queue_max: TTS queue bound (voicevox.tts_queue_max)
+            audio_queue_max: Audio play queue bound (voicevox.audio_queue_max)
         """
         self.tts_engine = tts_engine
-        self.translation_queue: asyncio.Queue[TranslationRequest] = asyncio.Queue()
-        self.tts_queue: asyncio.Queue[TTSRequest] = asyncio.Queue()
-        self.audio_play_queue: asyncio.Queue[AudioPlayRequest] = asyncio.Queue()
+        # Translation queue is unbounded so /translate_and_speak never blocks; the
+        # bounded downstream queues push back on the workers instead
+        self.translation_queue: asyncio.Queue[Optional[TranslationRequest]] = asyncio.Queue()
+        self.tts_queue: asyncio.Queue[Optional[TTSRequest]] = asyncio.Queue(maxsize=tts_queue_max)
+        self.audio_play_queue: asyncio.Queue[Optional[AudioPlayRequest]] = asyncio.Queue(maxsize=audio_queue_max)
         self._translation_worker_task: Optional[asyncio.Task] = None
         self._tts_worker_task: Optional[asyncio.Task] = None
         self._audio_play_worker_task: Optional[asyncio.Task] = None
         self._running = False
+        self._discarding = False  # Set by stop(): drop work instead of playing it
+
+        # Queued texts are translated concurrently up to what Ollama serves in parallel
+        if translation_concurrency is None:
+            translation_concurrency = _ollama_num_parallel()
+        self.translation_concurrency = max(1, translation_concurrency)
 
         # Semaphore to limit TTS concurrency (prevent VRAM overload)
-        # Only allow 1 TTS task at a time to avoid GPU memory issues
-        self._tts_semaphore = asyncio.Semaphore(1)
+        # Default 1; with 2-3 the next text's audio_query overlaps the current
+        # synthesis (the engine itself still runs one /synthesis at a time)
+        self._tts_semaphore = AdjustableSemaphore(tts_concurrency)
 
         # Statistics
         self.stats = {
             "translation_processed": 0,
             "translation_failed": 0,
+            "translation_queue_waits": 0,  # Awaited drain() calls (one per batch, not per request)
             "tts_processed": 0,
             "tts_failed": 0,
             "audio_play_processed": 0,
             "audio_play_failed": 0,
+            "queue_full_warnings": 0,  # Puts that had to wait for a full TTS/audio queue
         }
 
     async def start(self):
@@ -110,44 +222,89 @@ class TranslationTTSWorkerSystem:
         self._audio_play_worker_task = asyncio.create_task(self._audio_play_worker())
         logger.info("Translation+TTS+AudioPlay triple-queue workers started")
 
-    async def stop(self, timeout: float = 10.0):
-        """Stop all three workers gracefully."""
+    async def stop(self, timeout: float = 2.0, finish_queued: bool = False):
+        """
+        Stop all three workers.
+
+        By default queued requests are discarded and in-flight results are
+        dropped instead of played, so shutdown is quick. With finish_queued=True
+        everything already queued is translated, synthesized and played first
+        (pass a timeout long enough for that).
+        """
         if not self._running:
             return
 
         self._running = False
         logger.info("Stopping Translation+TTS+AudioPlay workers...")
 
-        # Cancel worker tasks
-        tasks = []
-        if self._translation_worker_task:
-            self._translation_worker_task.cancel()
-            tasks.append(self._translation_worker_task)
-        if self._tts_worker_task:
-            self._tts_worker_task.cancel()
-            tasks.append(self._tts_worker_task)
-        if self._audio_play_worker_task:
-            self._audio_play_worker_task.cancel()
-            tasks.append(self._audio_play_worker_task)
-
-        # Wait for cancellation with timeout
+        if not finish_queued:
+            self._discarding = True
+            discarded = [
+                req
+                for queue in (self.translation_queue, self.tts_queue, self.audio_play_queue)
+                for req in self._take_all(queue)
+            ]
+            if discarded:
+                logger.info(f"Discarding {len(discarded)} queued request(s)")
+                await asyncio.to_thread(self._delete_discarded_audio, discarded)
+
+        # Sentinel: the translation worker passes it to the TTS worker behind its
+        # last text, which in turn passes it on to playback behind its last clip
+        self.translation_queue.put_nowait(None)
+
+        tasks = [
+            task for task in (
+                self._translation_worker_task,
+                self._tts_worker_task,
+                self._audio_play_worker_task,
+            ) if task
+        ]
+
+        # Wait for workers to drain, cancel whatever is still running after timeout
         if tasks:
-            try:
-                await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True),
-                    timeout=timeout
-                )
-            except asyncio.TimeoutError:
-                logger.warning("Worker stop timeout exceeded")
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            if pending:
+                logger.warning("Worker stop timeout exceeded, cancelling remaining workers")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
 
         logger.info(f"Workers stopped. Stats: {self.stats}")
 
+    @staticmethod
+    def _take_all(queue: asyncio.Queue) -> list:
+        """Remove and return everything currently in queue (marking it done)."""
+        items = []
+        while not queue.empty():
+            items.append(queue.get_nowait())
+            queue.task_done()
+        return items
+
+    @staticmethod
+    def _delete_discarded_audio(requests: list) -> None:
+        """Delete the temporary WAVs of discarded play requests (called from a thread)."""
+        for req in requests:
+            if isinstance(req, AudioPlayRequest) and req.delete_after_play:
+                req.audio_path.unlink(missing_ok=True)
+
     async def enqueue_translation(self, text: str, request_id: str, return_audio: bool = False):
         """Enqueue a translation request."""
         req = TranslationRequest(text=text, request_id=request_id, return_audio=return_audio)
         await self.translation_queue.put(req)
         logger.info(f"[{request_id}] Enqueued for translation (queue size: {self.translation_queue.qsize()})")
 
+    async def set_tts_concurrency(self, limit: int):
+        """Change the TTS in-flight limit at runtime (takes effect for the next request)."""
+        await self._tts_semaphore.set_limit(limit)
+        logger.info(f"TTS concurrency set to {self._tts_semaphore.limit}")
+
+    async def _put_with_backpressure(self, queue: asyncio.Queue, req: Any, name: str):
+        """Put req on a bounded queue, counting and logging when it has to wait for room."""
+        if queue.full():
+            self.stats["queue_full_warnings"] += 1
+            logger.warning(f"[{req.request_id}] {name} queue full ({queue.maxsize}), waiting for room")
+        await queue.put(req)
+
     def get_translation_queue_size(self) -> int:
         """Get current translation queue size."""
         return self.translation_queue.qsize()
@@ -160,133 +317,216 @@ class TranslationTTSWorkerSystem:
         """Get current audio play queue size."""
         return self.audio_play_queue.qsize()
 
+    async def _translate_request(self, req: TranslationRequest) -> Optional[str]:
+        """
+        Translate one request, logging and counting failures.
+
+        Returns:
+            Japanese text, or None if translation failed
+        """
+        try:
+            logger.info(f"[{req.request_id}] Translating: {req.text[:50]}...")
+
+            # Check if text is pre-translated Japanese (wrapped in『』)
+            if req.text.startswith("『") and req.text.endswith("』"):
+                # Skip translation, use text as-is (TTS will ignore『』markers)
+                japanese_text = req.text
+                logger.info(f"[{req.request_id}] Pre-translated Japanese detected, skipping model call")
+            else:
+                # Translate to Japanese
+                japanese_text = await translate_to_japanese(req.text)
+
+            logger.info(f"[{req.request_id}] Translation result: {japanese_text}")
+            return japanese_text
+
+        except asyncio.TimeoutError:
+            # Expected error: Ollama hung or reloading the model
+            # Log concisely without full stack trace
+            text_preview = req.text[:100] + ('...' if len(req.text) > 100 else '')
+            logger.warning(f"[{req.request_id}] Translation timeout. Ollama took too long to translate: {text_preview}")
+
+        except ValueError as e:
+            # Expected error: Translation validation failed (model crash)
+            logger.warning(f"[{req.request_id}] Translation validation failed: {e}")
+
+        except Exception as e:
+            # Unexpected errors: log with full stack trace
+            logger.error(f"[{req.request_id}] Translation failed: {e}", exc_info=True)
+
+        self.stats["translation_failed"] += 1
+        return None
+
     async def _translation_worker(self):
-        """Background worker: translates text and forwards to TTS queue."""
+        """
+        Background worker: translates text and forwards to TTS queue.
+
+        Requests already queued are translated concurrently (up to
+        translation_concurrency), but forwarded to the TTS queue in arrival order
+        (each as soon as it and all earlier ones are done), so speech order is preserved.
+        """
         logger.info("Translation worker started")
 
         try:
-            while self._running:
-                try:
-                    # Wait for translation request with timeout
-                    req = await asyncio.wait_for(
-                        self.translation_queue.get(),
-                        timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    continue
+            stopping = False
+            while not stopping:
+                # Wait for translation requests (None means stop)
+                batch = await drain(self.translation_queue, self.translation_concurrency)
+                self.stats["translation_queue_waits"] += 1
+
+                if None in batch:
+                    # Requests queued after the sentinel are dropped
+                    stop_index = batch.index(None)
+                    for _ in batch[stop_index:]:
+                        self.translation_queue.task_done()
+                    batch = batch[:stop_index]
+                    stopping = True
+                if len(batch) > 1:
+                    logger.info(f"Translating {len(batch)} queued requests concurrently")
+                tasks = [asyncio.create_task(self._translate_request(r)) for r in batch]
 
                 try:
-                    logger.info(f"[{req.request_id}] Translating: {req.text[:50]}...")
-
-                    # Check if text is pre-translated Japanese (wrapped in『』)
-                    if req.text.startswith("『") and req.text.endswith("』"):
-                        # Skip translation, use text as-is (TTS will ignore『』markers)
-                        japanese_text = req.text
-                        logger.info(f"[{req.request_id}] Pre-translated Japanese detected, skipping model call")
-                    else:
-                        # Translate to Japanese
-                        japanese_text = await translate_to_japanese(req.text)
-
-                    logger.info(f"[{req.request_id}] Translation result: {japanese_text}")
-
-                    # Enqueue to TTS queue
-                    tts_req = TTSRequest(
-                        japanese_text=japanese_text,
-                        request_id=req.request_id,
-                        return_audio=req.return_audio
-                    )
-                    await self.tts_queue.put(tts_req)
-                    logger.info(f"[{req.request_id}] Enqueued to TTS queue (size: {self.tts_queue.qsize()})")
-
-                    self.stats["translation_processed"] += 1
-
-                except ValueError as e:
-                    # Expected error: Translation validation failed (model crash)
-                    logger.warning(f"[{req.request_id}] Translation validation failed: {e}")
-                    self.stats["translation_failed"] += 1
+                    for req, task in zip(batch, tasks):
+                        try:
+                            japanese_text = await task
+                            if japanese_text is None or self._discarding:
+                                continue
 
-                except Exception as e:
-                    # Unexpected errors: log with full stack trace
-                    logger.error(f"[{req.request_id}] Translation failed: {e}", exc_info=True)
-                    self.stats["translation_failed"] += 1
+                            # Enqueue to TTS queue
+                            tts_req = TTSRequest(
+                                japanese_text=japanese_text,
+                                request_id=req.request_id,
+                                return_audio=req.return_audio
+                            )
+                            await self._put_with_backpressure(self.tts_queue, tts_req, "TTS")
+                            logger.info(f"[{req.request_id}] Enqueued to TTS queue (size: {self.tts_queue.qsize()})")
 
+                            self.stats["translation_processed"] += 1
+
+                        finally:
+                            self.translation_queue.task_done()
                 finally:
-                    self.translation_queue.task_done()
+                    # Worker cancelled mid-batch: don't leave translations running
+                    for task in tasks:
+                        task.cancel()
+
+            # Pass the stop sentinel on behind the last translated text
+            await self.tts_queue.put(None)
+            logger.info("Translation worker stopped")
 
         except asyncio.CancelledError:
             logger.info("Translation worker cancelled")
         except Exception as e:
             logger.error(f"Translation worker crashed: {e}", exc_info=True)
 
+    async def _synthesize_request(self, req: TTSRequest) -> Optional[Path]:
+        """
+        Synthesize one request, logging and counting failures.
+
+        Returns:
+            Path to the WAV file, or None if synthesis failed
+        """
+        try:
+            logger.info(f"[{req.request_id}] Synthesizing TTS: {req.japanese_text}")
+
+            # Synthesize audio to temporary file with unique request ID
+            # VOICEVOX engine uses async methods
+            audio_path = await self.tts_engine.synthesize_to_file(
+                req.japanese_text,
+                request_id=req.request_id
+            )
+            logger.info(f"[{req.request_id}] Audio generated: {audio_path.name}")
+            return audio_path
+
+        except asyncio.TimeoutError:
+            # Expected error: VOICEVOX processing timeout
+            # Log concisely without full stack trace
+            timeout_val = getattr(self.tts_engine, 'timeout_seconds', 'unknown')
+            text_preview = req.japanese_text[:100] + ('...' if len(req.japanese_text) > 100 else '')
+            logger.warning(
+                f"[{req.request_id}] TTS timeout after {timeout_val}s. "
+                f"VOICEVOX took too long to process text: {text_preview}"
+            )
+
+        except Exception as e:
+            # Unexpected errors: log with full stack trace for debugging
+            logger.error(f"[{req.request_id}] TTS failed: {e}", exc_info=True)
+
+        self.stats["tts_failed"] += 1
+        return None
+
+    async def _process_tts_request(self, req: TTSRequest, previous: Optional[asyncio.Task]):
+        """
+        Synthesize req, then forward it to the audio play queue once the previous
+        request has been forwarded, so playback order matches arrival order even
+        when syntheses overlap.
+
+        The semaphore slot taken by the worker is held until the clip is forwarded:
+        finished clips waiting on a slow predecessor (or a full audio play queue)
+        count against tts_concurrency, which is what pushes back on the TTS queue.
+        """
+        try:
+            audio_path = await self._synthesize_request(req)
+
+            if previous is not None:
+                await asyncio.wait([previous])
+            if audio_path is None:
+                return
+            if self._discarding:
+                # Stopping: the clip won't be played
+                await asyncio.to_thread(audio_path.unlink, missing_ok=True)
+                return
+
+            if not req.return_audio:
+                # Enqueue to audio play queue
+                play_req = AudioPlayRequest(
+                    audio_path=audio_path,
+                    request_id=req.request_id,
+                    delete_after_play=True
+                )
+                await self._put_with_backpressure(self.audio_play_queue, play_req, "audio play")
+                logger.info(f"[{req.request_id}] Enqueued to audio play queue (size: {self.audio_play_queue.qsize()})")
+            else:
+                # For return_audio mode, just log (caller would need to handle response)
+                logger.info(f"[{req.request_id}] Audio ready at {audio_path} (return_audio=True)")
+
+            self.stats["tts_processed"] += 1
+
+        finally:
+            await self._tts_semaphore.release()
+            self.tts_queue.task_done()
+
     async def _tts_worker(self):
         """Background worker: synthesizes audio and forwards to audio play queue."""
         logger.info("TTS worker started")
+        in_flight: set[asyncio.Task] = set()
+        last_task: Optional[asyncio.Task] = None
 
         try:
-            while self._running:
-                try:
-                    # Wait for TTS request with timeout
-                    req = await asyncio.wait_for(
-                        self.tts_queue.get(),
-                        timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    continue
-
-                # Use semaphore to ensure only one TTS task runs at a time
-                # This prevents concurrent requests to VOICEVOX service
-                async with self._tts_semaphore:
-                    try:
-                        logger.info(f"[{req.request_id}] Synthesizing TTS: {req.japanese_text}")
-                        logger.info(f"[{req.request_id}] Using request_id for filename: {req.request_id}")
-
-                        # Synthesize audio to temporary file with unique request ID
-                        # VOICEVOX engine uses async methods
-                        audio_path = await self.tts_engine.synthesize_to_file(
-                            req.japanese_text,
-                            request_id=req.request_id
-                        )
-                        logger.info(f"[{req.request_id}] Audio generated: {audio_path.name}")
-
-                        if not req.return_audio:
-                            # Enqueue to audio play queue
-                            play_req = AudioPlayRequest(
-                                audio_path=audio_path,
-                                request_id=req.request_id,
-                                delete_after_play=True
-                            )
-                            await self.audio_play_queue.put(play_req)
-                            logger.info(f"[{req.request_id}] Enqueued to audio play queue (size: {self.audio_play_queue.qsize()})")
-                        else:
-                            # For return_audio mode, just log (caller would need to handle response)
-                            logger.info(f"[{req.request_id}] Audio ready at {audio_path} (return_audio=True)")
-
-                        self.stats["tts_processed"] += 1
-
-                        # Short delay after synthesis to allow GPU cache cleanup
-                        await asyncio.sleep(0.1)
-
-                    except asyncio.TimeoutError:
-                        # Expected error: VOICEVOX processing timeout
-                        # Log concisely without full stack trace
-                        timeout_val = getattr(self.tts_engine, 'timeout_seconds', 'unknown')
-                        text_preview = req.japanese_text[:100] + ('...' if len(req.japanese_text) > 100 else '')
-                        logger.warning(
-                            f"[{req.request_id}] TTS timeout after {timeout_val}s. "
-                            f"VOICEVOX took too long to process text: {text_preview}"
-                        )
-                        self.stats["tts_failed"] += 1
-
-                    except Exception as e:
-                        # Unexpected errors: log with full stack trace for debugging
-                        logger.error(f"[{req.request_id}] TTS failed: {e}", exc_info=True)
-                        self.stats["tts_failed"] += 1
-
-                    finally:
-                        self.tts_queue.task_done()
+            while True:
+                # Take a semaphore slot before dequeuing, so requests waiting for
+                # VOICEVOX stay visible in the TTS queue size
+                await self._tts_semaphore.acquire()
+
+                # Wait for TTS request (None means stop)
+                req = await self.tts_queue.get()
+                if req is None:
+                    await self._tts_semaphore.release()
+                    if in_flight:
+                        await asyncio.wait(in_flight)
+                    self.tts_queue.task_done()
+                    # Pass the stop sentinel on behind the last synthesized clip
+                    await self.audio_play_queue.put(None)
+                    logger.info("TTS worker stopped")
+                    break
+
+                last_task = asyncio.create_task(self._process_tts_request(req, last_task))
+                in_flight.add(last_task)
+                last_task.add_done_callback(in_flight.discard)
 
         except asyncio.CancelledError:
             logger.info("TTS worker cancelled")
+            for task in in_flight:
+                task.cancel()
         except Exception as e:
             logger.error(f"TTS worker crashed: {e}", exc_info=True)
 
@@ -295,33 +535,39 @@ class TranslationTTSWorkerSystem:
         logger.info("Audio play worker started")
 
         try:
-            while self._running:
-                try:
-                    # Wait for audio play request with timeout
-                    req = await asyncio.wait_for(
-                        self.audio_play_queue.get(),
-                        timeout=1.0
-                    )
-                except asyncio.TimeoutError:
+            while True:
+                # Wait for audio play request (None means stop)
+                req = await self.audio_play_queue.get()
+                if req is None:
+                    self.audio_play_queue.task_done()
+                    logger.info("Audio play worker stopped")
+                    break
+
+                if self._discarding:
+                    # Stopping: clip forwarded after stop() cleared the queue
+                    await asyncio.to_thread(self._delete_discarded_audio, [req])
+                    self.audio_play_queue.task_done()
                     continue
 
                 try:
                     logger.info(f"[{req.request_id}] Playing audio: {req.audio_path.name}")
-                    logger.info(f"[{req.request_id}] Audio file exists: {req.audio_path.exists()}")
-                    logger.info(f"[{req.request_id}] Audio file size: {req.audio_path.stat().st_size if req.audio_path.exists() else 'N/A'} bytes")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        # File diagnostics cost extra stat() calls, only pay them when debugging
+                        logger.debug(f"[{req.request_id}] Audio file exists: {req.audio_path.exists()}")
+                        logger.debug(f"[{req.request_id}] Audio file size: {req.audio_path.stat().st_size if req.audio_path.exists() else 'N/A'} bytes")
 
                     # Play audio
                     await self._play_audio(req.audio_path)
                     logger.info(f"[{req.request_id}] Audio played successfully")
 
                     # Delete temporary file if requested
+                    # (unlink runs in a thread so slow disks don't stall the event loop)
                     if req.delete_after_play:
                         try:
-                            if req.audio_path.exists():
-                                req.audio_path.unlink()
-                                logger.info(f"[{req.request_id}] Deleted temporary file: {req.audio_path.name}")
-                            else:
-                                logger.warning(f"[{req.request_id}] File already deleted: {req.audio_path.name}")
+                            await asyncio.to_thread(req.audio_path.unlink)
+                            logger.info(f"[{req.request_id}] Deleted temporary file: {req.audio_path.name}")
+                        except FileNotFoundError:
+                            logger.warning(f"[{req.request_id}] File already deleted: {req.audio_path.name}")
                         except Exception as e:
                             logger.warning(f"[{req.request_id}] Failed to delete temporary file: {e}")
 
@@ -347,23 +593,27 @@ class TranslationTTSWorkerSystem:
         Args:
             audio_path: Path to WAV audio file
         """
-        # Choose player based on platform
-        if sys.platform == "win32":
-            cmd = ['powershell', '-Command', f'(New-Object Media.SoundPlayer "{audio_path}").PlaySync()']
-        elif sys.platform == "darwin":
-            cmd = ['afplay', str(audio_path)]
-        else:
-            cmd = ['aplay', str(audio_path)]
+        if _USE_WINSOUND:
+            # PlaySound blocks until the clip ends, keep it off the event loop
+            await asyncio.to_thread(_play_wav_blocking, audio_path)
+            logger.debug("Audio playback completed: %s", audio_path.name)
+            return
 
         # Execute and wait for completion
         process = await asyncio.create_subprocess_exec(
-            *cmd,
+            *_player_command(audio_path),
             stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL
+            stderr=asyncio.subprocess.DEVNULL,
+            close_fds=False  # our fds are non-inheritable anyway (PEP 446); allows posix_spawn
         )
 
-        await process.wait()
-        logger.debug(f"Audio playback completed: {audio_path.name}")
+        try:
+            await process.wait()
+        except asyncio.CancelledError:
+            # Worker cancelled on shutdown: don't leave the player running
+            process.kill()
+            raise
+        logger.debug("Audio playback completed: %s", audio_path.name)
 
 
 # Global instance (will be initialized in server startup)
@@ -5,45 +5,30 @@ Creates VOICEVOX TTS engine based on configuration.
 """
 
 import logging
-from pathlib import Path
-import yaml
 
+from server.config import VoicevoxConfig
 from server.core.tts_voicevox import VoicevoxEngine
 
 logger = logging.getLogger(__name__)
 
 
-def create_tts_engine(config_path: Path = Path("config.yaml")) -> VoicevoxEngine:
+def create_tts_engine(config: VoicevoxConfig) -> VoicevoxEngine:
     """
     Create VOICEVOX TTS engine based on configuration.
 
     Args:
-        config_path: Path to configuration file
+        config: voicevox section of the server configuration
 
     Returns:
         VoicevoxEngine instance
-
-    Raises:
-        FileNotFoundError: If config file not found
-        RuntimeError: If VOICEVOX service unavailable
     """
-    # Load configuration
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-
-    # Get VOICEVOX configuration
-    voicevox_config = config.get("voicevox", {})
-
     logger.info("Creating VOICEVOX TTS engine")
 
     # Create VOICEVOX engine
     engine = VoicevoxEngine(
-        base_url=voicevox_config.get("base_url", "http://localhost:50021"),
-        speaker_id=voicevox_config.get("speaker_id", 14),
-        timeout=voicevox_config.get("timeout", 30.0)
+        base_url=config.base_url,
+        speaker_id=config.speaker_id,
+        timeout=config.timeout
     )
 
     logger.info(f"  Base URL: {engine.base_url}")
@@ -53,23 +38,20 @@ def create_tts_engine(config_path: Path = Path("config.yaml")) -> VoicevoxEngine
     return engine
 
 
-async def create_tts_engine_with_health_check(
-    config_path: Path = Path("config.yaml")
-) -> VoicevoxEngine:
+async def create_tts_engine_with_health_check(config: VoicevoxConfig) -> VoicevoxEngine:
     """
     Create VOICEVOX TTS engine and verify service is available.
 
     Args:
-        config_path: Path to configuration file
+        config: voicevox section of the server configuration
 
     Returns:
         VoicevoxEngine instance
 
     Raises:
-        FileNotFoundError: If config file not found
         RuntimeError: If VOICEVOX service unavailable
     """
-    engine = create_tts_engine(config_path)
+    engine = create_tts_engine(config)
 
     # Check if VOICEVOX is available
     logger.info("Checking VOICEVOX service health...")
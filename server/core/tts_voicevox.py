@@ -4,14 +4,24 @@ VOICEVOX TTS Engine Implementation.
 Provides text-to-speech synthesis using VOICEVOX Engine API.
 """
 
+import hashlib
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, Optional
+import aiofiles
 import aiohttp
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Synthesized WAV cache (repeated phrases skip VOICEVOX entirely)
+TTS_CACHE_SIZE = 128  # Max clips
+TTS_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Max total WAV bytes
+
+# /synthesis response body is streamed in chunks of this size
+SYNTHESIS_CHUNK_SIZE = 64 * 1024
+
 
 class VoicevoxEngine:
     """
@@ -41,6 +51,18 @@ class VoicevoxEngine:
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self._session: Optional[aiohttp.ClientSession] = None
 
+        # /audio_query is a CPU text frontend, /synthesis is the GPU model forward:
+        # concurrent requests may overlap the former but never run the latter in parallel
+        self._synthesis_semaphore = asyncio.Semaphore(1)
+
+        # LRU cache of synthesized WAVs: key -> bytes (oldest first)
+        self._wav_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._wav_cache_bytes = 0
+
+        # Temporary WAV output directory (created once, on first synthesis)
+        self.output_dir = Path("audio/tmp")
+        self._output_dir_ready = False
+
         logger.info(f"VoicevoxEngine initialized: {self.base_url}")
         logger.info(f"  Default speaker ID: {self.speaker_id}")
         logger.info(f"  Timeout: {self.timeout_seconds}s")
@@ -70,6 +92,27 @@ class VoicevoxEngine:
             logger.error(f"VOICEVOX health check failed: {e}")
             return False
 
+    async def warmup(self, speaker_id: Optional[int] = None) -> None:
+        """
+        Load the speaker model and run one short synthesis.
+
+        VOICEVOX loads a speaker's model on its first synthesis, so without this
+        the first real request pays several seconds of cold start.
+
+        Raises:
+            aiohttp.ClientError: If API request fails
+        """
+        speaker = speaker_id if speaker_id is not None else self.speaker_id
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/initialize_speaker",
+            params={"speaker": speaker, "skip_reinit": "true"}
+        ) as resp:
+            resp.raise_for_status()
+
+        # Audio is discarded: this only primes the audio_query/synthesis path
+        await self.synthesize("あ", speaker_id=speaker)
+
     async def get_speakers(self) -> list[Dict[str, Any]]:
         """
         Get list of available speakers.
@@ -114,6 +157,38 @@ class VoicevoxEngine:
         Returns:
             WAV audio bytes
 
+        Raises:
+            aiohttp.ClientError: If API request fails
+            ValueError: If text is empty
+        """
+        chunks: list[bytes] = []
+
+        async def collect(chunk: bytes) -> None:
+            chunks.append(chunk)
+
+        await self._synthesize_stream(
+            text, speaker_id, collect,
+            speed_scale=speed_scale, pitch_scale=pitch_scale, volume_scale=volume_scale
+        )
+        return b"".join(chunks)
+
+    async def _synthesize_stream(
+        self,
+        text: str,
+        speaker_id: Optional[int],
+        on_chunk: Callable[[bytes], Awaitable[None]],
+        speed_scale: float = 1.0,
+        pitch_scale: float = 1.0,
+        volume_scale: float = 1.0
+    ) -> int:
+        """
+        Synthesize speech, passing the WAV to on_chunk as it arrives.
+
+        A cached clip is passed as a single chunk.
+
+        Returns:
+            Total WAV bytes delivered
+
         Raises:
             aiohttp.ClientError: If API request fails
             ValueError: If text is empty
@@ -123,6 +198,18 @@ class VoicevoxEngine:
             raise ValueError("text is required")
 
         speaker = speaker_id if speaker_id is not None else self.speaker_id
+
+        cache_key = hashlib.blake2b(
+            f"{text}|{speaker}|{speed_scale}|{pitch_scale}|{volume_scale}".encode("utf-8"),
+            digest_size=16
+        ).digest()
+        cached = self._wav_cache.get(cache_key)
+        if cached is not None:
+            self._wav_cache.move_to_end(cache_key)
+            logger.info(f"Using cached audio ({len(cached)} bytes)")
+            await on_chunk(cached)
+            return len(cached)
+
         session = await self._get_session()
 
         # Step 1: Generate AudioQuery
@@ -142,18 +229,41 @@ class VoicevoxEngine:
         if volume_scale != 1.0:
             audio_query["volumeScale"] = volume_scale
 
-        # Step 2: Synthesize audio
+        # Step 2: Synthesize audio, streaming the body instead of reading it whole
         logger.debug(f"Synthesizing audio with speaker {speaker}")
-        async with session.post(
-            f"{self.base_url}/synthesis",
-            params={"speaker": speaker},
-            json=audio_query
-        ) as resp:
-            resp.raise_for_status()
-            wav_bytes = await resp.read()
-
-        logger.info(f"Synthesized {len(wav_bytes)} bytes of audio")
-        return wav_bytes
+        chunks: list[bytes] = []
+        total = 0
+        async with self._synthesis_semaphore:
+            async with session.post(
+                f"{self.base_url}/synthesis",
+                params={"speaker": speaker},
+                json=audio_query
+            ) as resp:
+                resp.raise_for_status()
+                async for chunk in resp.content.iter_chunked(SYNTHESIS_CHUNK_SIZE):
+                    await on_chunk(chunk)
+                    total += len(chunk)
+                    # Keep a copy only while the clip still fits in the cache
+                    if total <= TTS_CACHE_MAX_BYTES:
+                        chunks.append(chunk)
+
+        logger.info(f"Synthesized {total} bytes of audio")
+        if total <= TTS_CACHE_MAX_BYTES:
+            self._cache_wav(cache_key, b"".join(chunks))
+        return total
+
+    def _cache_wav(self, key: bytes, wav_bytes: bytes) -> None:
+        """Store a synthesized clip, evicting least recently used clips over the size limits."""
+        if len(wav_bytes) > TTS_CACHE_MAX_BYTES:
+            return
+        previous = self._wav_cache.pop(key, None)
+        if previous is not None:
+            self._wav_cache_bytes -= len(previous)
+        self._wav_cache[key] = wav_bytes
+        self._wav_cache_bytes += len(wav_bytes)
+        while len(self._wav_cache) > TTS_CACHE_SIZE or self._wav_cache_bytes > TTS_CACHE_MAX_BYTES:
+            _, evicted = self._wav_cache.popitem(last=False)
+            self._wav_cache_bytes -= len(evicted)
 
     async def synthesize_to_file(
         self,
@@ -191,26 +301,30 @@ class VoicevoxEngine:
         # Map speed parameter to VOICEVOX speed_scale
         speed_scale = speed if speed is not None else kwargs.get('speed_scale', 1.0)
 
-        # Generate audio
-        synthesize_kwargs = {
-            'speaker_id': speaker_id,
-            'speed_scale': speed_scale,
-            'pitch_scale': kwargs.get('pitch_scale', 1.0),
-            'volume_scale': kwargs.get('volume_scale', 1.0)
-        }
-        wav_bytes = await self.synthesize(text, **synthesize_kwargs)
-
         # Save to temporary file
-        output_dir = Path("audio/tmp")
-        output_dir.mkdir(parents=True, exist_ok=True)
+        if not self._output_dir_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dir_ready = True
 
         if request_id:
-            output_path = output_dir / f"tts_{request_id}.wav"
+            output_path = self.output_dir / f"tts_{request_id}.wav"
         else:
             import uuid
-            output_path = output_dir / f"tts_{uuid.uuid4().hex[:8]}.wav"
+            output_path = self.output_dir / f"tts_{uuid.uuid4().hex[:8]}.wav"
 
-        output_path.write_bytes(wav_bytes)
+        # Stream the WAV straight into the file without blocking the event loop
+        try:
+            async with aiofiles.open(output_path, "wb") as f:
+                await self._synthesize_stream(
+                    text, speaker_id, f.write,
+                    speed_scale=speed_scale,
+                    pitch_scale=kwargs.get('pitch_scale', 1.0),
+                    volume_scale=kwargs.get('volume_scale', 1.0)
+                )
+        except BaseException:
+            # Don't leave a truncated WAV behind for cleanup to find
+            output_path.unlink(missing_ok=True)
+            raise
         logger.info(f"Saved audio to {output_path}")
 
         return output_path
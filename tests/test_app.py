@@ -16,9 +16,84 @@ from unittest.mock import AsyncMock, patch
 import httpx
 
 
+class TestDeduplication:
+    """Test duplicate request detection in /translate_and_speak."""
+
+    def test_repeated_text_is_duplicate(self):
+        """Same text within the window is a duplicate."""
+        from server.app import RequestDeduplicator
+        dedup = RequestDeduplicator()
+        assert not dedup.is_duplicate("Running tests")
+        assert dedup.is_duplicate("Running tests")
+        assert dedup.stats == {"hits": 1, "misses": 1}
+
+    def test_alternating_texts_are_duplicates(self):
+        """Every text in the window is remembered, not just the last one."""
+        from server.app import RequestDeduplicator
+        dedup = RequestDeduplicator()
+        assert not dedup.is_duplicate("first")
+        assert not dedup.is_duplicate("second")
+        assert dedup.is_duplicate("first")
+        assert dedup.is_duplicate("second")
+
+    def test_text_outside_window_is_not_duplicate(self):
+        """Entries older than the window expire."""
+        from server.app import RequestDeduplicator
+        dedup = RequestDeduplicator(window=-1.0)
+        assert not dedup.is_duplicate("Running tests")
+        assert not dedup.is_duplicate("Running tests")
+
+    def test_instances_do_not_share_state(self):
+        """Each app gets its own deduplication cache."""
+        from server.app import RequestDeduplicator
+        assert not RequestDeduplicator().is_duplicate("Running tests")
+        assert not RequestDeduplicator().is_duplicate("Running tests")
+
+
+class TestRequestId:
+    """Test per-process request ID generation."""
+
+    def test_request_ids_are_unique_hex(self):
+        """Consecutive IDs differ and are short hex strings."""
+        from server.app import _next_request_id
+        ids = [_next_request_id() for _ in range(100)]
+        assert len(set(ids)) == 100
+        assert all(int(i, 16) > 0 for i in ids)
+
+
 class TestHealthEndpoint:
     """Test /health endpoint for server health checks."""
 
+    @pytest.mark.asyncio
+    async def test_health_response_cached_briefly(self, monkeypatch):
+        """Polls within HEALTH_CACHE_TTL reuse the previous response."""
+        from types import SimpleNamespace
+        from server import app as app_module
+
+        class FakeWorker:
+            stats = {}
+            queue_size = 0
+
+            def get_translation_queue_size(self):
+                return self.queue_size
+
+            def get_tts_queue_size(self):
+                return 0
+
+        worker = FakeWorker()
+        state = SimpleNamespace(
+            translation_tts_worker=worker,
+            deduplicator=app_module.RequestDeduplicator()
+        )
+        http_request = SimpleNamespace(app=SimpleNamespace(state=state))
+
+        first = await app_module.health_check(http_request)
+        worker.queue_size = 3
+        assert await app_module.health_check(http_request) is first
+
+        monkeypatch.setattr(app_module, "HEALTH_CACHE_TTL", 0.0)
+        assert (await app_module.health_check(http_request)).translation_queue_size == 3
+
     @pytest.mark.asyncio
     async def test_health_endpoint_returns_ok(self):
         """Test that /health returns 200 OK."""
@@ -51,6 +51,19 @@ class TestConfigLoader:
         # assert config["server"]["port"] == 8765  # From env var
         # assert config["model_provider"]["type"] == "ollama"  # From env var
 
+    def test_env_overrides_applied(self, monkeypatch):
+        """Overrides are cast, create missing sections, and skip invalid ints."""
+        from server.config import _apply_env_overrides
+        monkeypatch.setenv("SERVER_PORT", "9000")
+        monkeypatch.setenv("OLLAMA_BASE_URL", "http://gpu-box:11434")
+        config = _apply_env_overrides({"server": {}, "model_provider": {}})
+        assert config["server"]["port"] == 9000
+        assert config["model_provider"]["ollama"]["base_url"] == "http://gpu-box:11434"
+
+        monkeypatch.setenv("SERVER_PORT", "not-a-port")
+        config = _apply_env_overrides({"server": {"port": 8765}, "model_provider": {}})
+        assert config["server"]["port"] == 8765
+
     def test_missing_required_config(self):
         """Test that missing required configuration raises error."""
         # Expected behavior: Should raise ValueError or ConfigError
@@ -164,6 +177,40 @@ class TestConfigHelpers:
         # assert resolved["api_key"] == "test-key-123"
 
 
+class TestBuildConfig:
+    """Test conversion of the config dict into the frozen AppConfig tree."""
+
+    def test_build_default_config(self):
+        """Default config converts to attribute access with the same values."""
+        from server.config import build_config, load_config
+        config = build_config(load_config())
+        assert config.server.port == 8765
+        assert config.model_provider.type == "ollama"
+        assert config.model_provider.ollama.base_url == "http://localhost:11434"
+        assert config.model_provider.claude is None
+        assert isinstance(config.audio_selector.audio_dir, Path)
+        assert config.voicevox.base_url == "http://localhost:50021"
+
+    def test_build_voicevox_section_from_yaml(self):
+        """The repo config.yaml voicevox settings reach the typed tree."""
+        from server.config import build_config, load_config
+        config_file = Path(__file__).parent.parent / "config.yaml"
+        config = build_config(load_config(str(config_file)))
+        assert config.voicevox.speaker_id == 20
+        assert config.voicevox.timeout == 60.0
+        assert config.voicevox.tts_concurrency == 1
+        assert config.voicevox.tts_queue_max == 4
+        assert config.voicevox.audio_queue_max == 4
+
+    def test_config_is_read_only(self):
+        """Attributes can't be reassigned or added."""
+        import dataclasses
+        from server.config import build_config, load_config
+        config = build_config(load_config())
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.server.port = 9000
+
+
 class TestConfigReload:
     """Test configuration reloading."""
 
@@ -64,7 +64,7 @@ def test_thinking_extraction():
     """Test the thinking extraction logic."""
     # Import the hook module
     import sys
-    sys.path.insert(0, str(Path(__file__).parent / "hook"))
+    sys.path.insert(0, str(Path(__file__).parent.parent / "hook"))
     from think_aloud_hook import get_last_thinking, extract_thinking_from_record
 
     # Create test transcript
@@ -97,10 +97,158 @@ def test_thinking_extraction():
         Path(transcript_path).unlink(missing_ok=True)
 
 
+def test_thinking_extraction_across_chunks(monkeypatch):
+    """Test reverse scanning when records span several read chunks."""
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent / "hook"))
+    import think_aloud_hook
+
+    # Force every record to cross chunk boundaries
+    monkeypatch.setattr(think_aloud_hook, "TRANSCRIPT_CHUNK_SIZE", 7)
+
+    transcript_path = create_test_transcript()
+    try:
+        lines = list(think_aloud_hook.iter_transcript_lines_reverse(transcript_path))
+        expected_lines = Path(transcript_path).read_bytes().splitlines()
+        assert lines == expected_lines[::-1]
+
+        assert think_aloud_hook.get_last_thinking(transcript_path) == (
+            "This is a test thinking block. It should be the last one extracted."
+        )
+    finally:
+        Path(transcript_path).unlink(missing_ok=True)
+
+
+def test_scan_from_previous_size(monkeypatch, tmp_path):
+    """Only lines appended after the previous scan are yielded, including a line cut off by it."""
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent / "hook"))
+    import think_aloud_hook
+
+    monkeypatch.setattr(think_aloud_hook, "TRANSCRIPT_CHUNK_SIZE", 5)
+    transcript = tmp_path / "transcript.jsonl"
+    transcript.write_bytes(b'{"a": 1}\n{"b": 2}\n{"c": 3}\n')
+
+    # Previous scan ended on a line boundary: only new lines are yielded
+    start = len(b'{"a": 1}\n{"b": 2}\n')
+    assert list(think_aloud_hook.iter_transcript_lines_reverse(str(transcript), start)) == [b'{"c": 3}']
+
+    # Previous scan saw "{"b" only: the whole line is yielded again
+    start = len(b'{"a": 1}\n{"b"')
+    assert list(think_aloud_hook.iter_transcript_lines_reverse(str(transcript), start)) == [b'{"c": 3}', b'{"b": 2}']
+
+    # Nothing appended since the previous scan
+    assert list(think_aloud_hook.iter_transcript_lines_reverse(str(transcript), transcript.stat().st_size)) == []
+
+
+def test_notification_skips_transcript(monkeypatch):
+    """Notification events only send the notification, without reading the transcript."""
+    import sys
+    import pytest
+    sys.path.insert(0, str(Path(__file__).parent.parent / "hook"))
+    import think_aloud_hook
+
+    sent = []
+    monkeypatch.setattr(think_aloud_hook, "read_stdin_json", lambda: {
+        "transcript_path": "/nonexistent/transcript.jsonl",
+        "hook_event_name": "Notification",
+        "message": "Claude needs your permission to use Bash",
+    })
+    monkeypatch.setattr(think_aloud_hook, "get_last_thinking", lambda path: pytest.fail("transcript was read"))
+    monkeypatch.setattr(think_aloud_hook, "call_translation_tts_api", lambda text: sent.append(text) or True)
+
+    with pytest.raises(SystemExit) as exc:
+        think_aloud_hook.main()
+
+    assert exc.value.code == 0
+    assert sent == ["『許可を願います！』"]
+
+
+def test_unchanged_transcript_is_not_rescanned(monkeypatch, tmp_path):
+    """A transcript with the same size and mtime as last run is not read again."""
+    import sys
+    import pytest
+    sys.path.insert(0, str(Path(__file__).parent.parent / "hook"))
+    import think_aloud_hook
+
+    transcript_path = create_test_transcript()
+    scans = []
+    monkeypatch.setattr(think_aloud_hook, "TRANSCRIPT_STATE_FILE", tmp_path / ".last_transcript_state")
+    monkeypatch.setattr(think_aloud_hook, "STATE_FILE", tmp_path / ".last_thinking_hash")
+    monkeypatch.setattr(think_aloud_hook, "read_stdin_json", lambda: {
+        "transcript_path": transcript_path,
+        "hook_event_name": "PreToolUse",
+    })
+    monkeypatch.setattr(think_aloud_hook, "get_last_thinking", lambda path, start=0: scans.append(start) or "thinking")
+    monkeypatch.setattr(think_aloud_hook, "call_translation_tts_api", lambda text: True)
+
+    try:
+        for _ in range(2):
+            with pytest.raises(SystemExit):
+                think_aloud_hook.main()
+        assert scans == [0]
+
+        # Appended transcript is scanned again, starting where the last scan ended
+        size = Path(transcript_path).stat().st_size
+        with open(transcript_path, "a", encoding="utf-8") as f:
+            f.write("{}\n")
+        with pytest.raises(SystemExit):
+            think_aloud_hook.main()
+        assert scans == [0, size]
+    finally:
+        Path(transcript_path).unlink(missing_ok=True)
+
+
+def test_api_calls_share_connection(monkeypatch):
+    """Consecutive API calls reuse one keep-alive connection."""
+    import sys
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    sys.path.insert(0, str(Path(__file__).parent.parent / "hook"))
+    import think_aloud_hook
+
+    connections = []
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+
+        def do_POST(self):
+            received.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+            body = b'{"status": "accepted"}'
+            self.send_response(202 if len(received) == 1 else 500)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(think_aloud_hook, "API_URL", f"http://127.0.0.1:{server.server_port}/translate_and_speak")
+    monkeypatch.setattr(think_aloud_hook, "_api_connection", None)
+
+    try:
+        assert think_aloud_hook.call_translation_tts_api("first") is True
+        assert think_aloud_hook.call_translation_tts_api("second") is False  # 500 is reported as failure
+    finally:
+        think_aloud_hook._close_api_connection()
+        server.shutdown()
+        server.server_close()
+
+    assert [r["text"] for r in received] == ["first", "second"]
+    assert len(connections) == 1
+
+
 def test_hash_persistence():
     """Test hash persistence logic."""
     import sys
-    sys.path.insert(0, str(Path(__file__).parent / "hook"))
+    sys.path.insert(0, str(Path(__file__).parent.parent / "hook"))
     from think_aloud_hook import compute_hash, write_last_hash, read_last_hash, STATE_FILE
 
     print("\n=== Testing Hash Persistence ===")
@@ -0,0 +1,149 @@
+"""
+Unit tests for server/core/translation.py - translation fast paths.
+
+These tests run without Ollama: they only cover inputs that never reach the model.
+"""
+import asyncio
+
+import pytest
+
+from server.core import translation
+from server.core.translation import is_already_japanese, translate_to_japanese
+
+
+class TestAlreadyJapanese:
+    """Test detection of text that needs no translation."""
+
+    def test_kana_text_is_japanese(self):
+        """Text with kana and no Latin letters is already Japanese."""
+        assert is_already_japanese("テストを実行しました")
+
+    def test_english_is_not_japanese(self):
+        """Plain English must go through the model."""
+        assert not is_already_japanese("Running the tests now")
+
+    def test_mixed_text_is_not_japanese(self):
+        """Japanese with English terms still needs the model."""
+        assert not is_already_japanese("APIの設定を更新しました")
+
+    def test_chinese_is_not_japanese(self):
+        """Chinese (kanji only, no kana) must be translated."""
+        assert not is_already_japanese("正在运行测试")
+
+    @pytest.mark.asyncio
+    async def test_japanese_skips_model(self):
+        """Already-Japanese text is post-processed without calling Ollama."""
+        result = await translate_to_japanese("進捗は50%です")
+        assert result == "進捗は50パーセントです"
+
+
+class TestTranslationCache:
+    """Test the in-process translation result cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        translation._translation_cache.clear()
+        yield
+        translation._translation_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_cached_translation_skips_model(self, monkeypatch):
+        """A cached source text is returned without touching Ollama."""
+        translation._cache_put(translation._cache_key("Tests passed"), "テストが通りました")
+        monkeypatch.setattr(translation, "ollama", None)  # Any model call would raise
+
+        result = await translate_to_japanese("  Tests   passed ")
+        assert result == "テストが通りました"
+
+    def test_cache_stats_report_hit_ratio(self, monkeypatch):
+        """Lookups are counted as hits/misses for /health."""
+        monkeypatch.setitem(translation._translation_cache_stats, "hits", 0)
+        monkeypatch.setitem(translation._translation_cache_stats, "misses", 0)
+        key = translation._cache_key("Build finished")
+        translation._cache_get(key)
+        translation._cache_put(key, "ビルドが完了しました")
+        translation._cache_get(key)
+        translation._cache_get(key)
+
+        stats = translation.get_translation_cache_stats()
+        assert stats == {"hits": 2, "misses": 1, "hit_ratio": 0.667, "size": 1}
+
+    def test_expired_entry_is_dropped(self, monkeypatch):
+        """Entries older than the TTL are treated as misses."""
+        key = translation._cache_key("old text")
+        translation._cache_put(key, "古い")
+        monkeypatch.setattr(translation, "TRANSLATION_CACHE_TTL", -1.0)
+
+        assert translation._cache_get(key) is None
+        assert key not in translation._translation_cache
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """Cache never grows beyond TRANSLATION_CACHE_SIZE."""
+        monkeypatch.setattr(translation, "TRANSLATION_CACHE_SIZE", 2)
+        keys = [translation._cache_key(f"text {i}") for i in range(3)]
+        translation._cache_put(keys[0], "0")
+        translation._cache_put(keys[1], "1")
+        translation._cache_get(keys[0])  # Touch: keys[1] is now oldest
+        translation._cache_put(keys[2], "2")
+
+        assert list(translation._translation_cache) == [keys[0], keys[2]]
+
+
+class TestTranslationTimeout:
+    """Test that a hung Ollama request is abandoned after OLLAMA_TIMEOUT."""
+
+    @pytest.mark.asyncio
+    async def test_slow_model_raises_timeout(self, monkeypatch):
+        """TimeoutError propagates unwrapped so the worker can log it concisely."""
+        class HungClient:
+            async def chat(self, **kwargs):
+                await asyncio.sleep(10)
+
+        monkeypatch.setenv("OLLAMA_TIMEOUT", "0.01")
+        monkeypatch.setattr(translation, "_get_client", lambda: HungClient())
+
+        with pytest.raises(asyncio.TimeoutError):
+            await translate_to_japanese("This request never finishes")
+
+    @pytest.mark.asyncio
+    async def test_hung_warmup_raises_timeout(self, monkeypatch):
+        """A model load that never finishes gives up after WARMUP_TIMEOUT."""
+        class HungClient:
+            async def generate(self, **kwargs):
+                await asyncio.sleep(10)
+
+        monkeypatch.setattr(translation, "WARMUP_TIMEOUT", 0.01)
+        monkeypatch.setattr(translation, "_get_client", lambda: HungClient())
+
+        with pytest.raises(asyncio.TimeoutError):
+            await translation.warmup_translation_model()
+
+
+class TestCloseClient:
+    """Test shutting down the shared Ollama client."""
+
+    @pytest.mark.asyncio
+    async def test_close_is_idempotent(self, monkeypatch):
+        """Closing twice (or with no client yet) closes the client exactly once."""
+        closed = []
+
+        class FakeClient:
+            async def close(self):
+                closed.append(self)
+
+        monkeypatch.setattr(translation, "_client", FakeClient())
+        await translation.close_translation_client()
+        await translation.close_translation_client()
+
+        assert len(closed) == 1
+        assert translation._client is None
+
+    @pytest.mark.asyncio
+    async def test_close_without_close_method(self, monkeypatch):
+        """A client without a public close() (older ollama) doesn't break shutdown."""
+        class OldClient:
+            pass
+
+        monkeypatch.setattr(translation, "_client", OldClient())
+        await translation.close_translation_client()
+        assert translation._client is None
@@ -0,0 +1,94 @@
+"""
+Unit tests for server/core/translation_logger.py - buffered JSONL logging.
+"""
+import json
+import threading
+
+import pytest
+
+from server.core import translation_logger
+from server.core.translation_logger import close_translation_logger, log_translation
+
+
+@pytest.fixture
+def logs_dir(tmp_path, monkeypatch):
+    """Send log files to a temporary directory."""
+    monkeypatch.setattr(translation_logger, "_LOGS_DIR", tmp_path)
+    monkeypatch.setattr(translation_logger, "_cached_log_date", None)
+    monkeypatch.setattr(translation_logger, "_cached_git_hash", "abc123")
+    return tmp_path
+
+
+class TestBufferedLogging:
+    """Test that queued entries are written by the background flusher."""
+
+    @pytest.mark.asyncio
+    async def test_entries_written_on_close(self, logs_dir):
+        """All queued entries reach the file, in order, once the logger is closed."""
+        for i in range(5):
+            await log_translation(f"source {i}", f"翻訳 {i}")
+        await close_translation_logger()
+
+        (log_file,) = logs_dir.glob("translation_*.jsonl")
+        entries = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+        assert [e["source_text"] for e in entries] == [f"source {i}" for i in range(5)]
+        assert entries[0]["translated_text"] == "翻訳 0"
+        assert entries[0]["git_hash"] == "abc123"
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_entry(self, logs_dir, monkeypatch):
+        """Entries beyond the queue size are dropped instead of raising."""
+        monkeypatch.setattr(translation_logger, "LOG_QUEUE_SIZE", 1)
+        await log_translation("kept", "残す")
+        await log_translation("dropped", "捨てる")  # Flusher hasn't run yet
+        await close_translation_logger()
+
+        (log_file,) = logs_dir.glob("translation_*.jsonl")
+        assert [json.loads(line)["source_text"] for line in log_file.read_text(encoding="utf-8").splitlines()] == ["kept"]
+
+    @pytest.mark.asyncio
+    async def test_log_path_resolved_off_event_loop(self, logs_dir, monkeypatch):
+        """The daily path lookup (which may mkdir) runs in the executor, not the loop thread."""
+        resolve_path = translation_logger._get_log_file_path
+        threads = []
+
+        def recording_resolve():
+            threads.append(threading.current_thread())
+            return resolve_path()
+
+        monkeypatch.setattr(translation_logger, "_get_log_file_path", recording_resolve)
+        await log_translation("source", "翻訳")
+        await close_translation_logger()
+
+        assert threads and threading.main_thread() not in threads
+
+
+class TestGitHash:
+    """Test resolving HEAD from .git files without running git."""
+
+    def test_loose_ref(self, tmp_path):
+        """HEAD pointing to a branch reads the loose ref file."""
+        git_dir = tmp_path / ".git"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "refs" / "heads" / "main").write_text("a" * 40 + "\n")
+        assert translation_logger._read_git_hash(tmp_path) == "a" * 40
+
+    def test_packed_ref(self, tmp_path):
+        """Refs missing on disk are looked up in packed-refs."""
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted\n"
+            + "b" * 40 + " refs/heads/dev\n"
+            + "c" * 40 + " refs/heads/main\n"
+        )
+        assert translation_logger._read_git_hash(tmp_path) == "c" * 40
+
+    def test_detached_head(self, tmp_path):
+        """Detached HEAD contains the hash itself."""
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "HEAD").write_text("d" * 40 + "\n")
+        assert translation_logger._read_git_hash(tmp_path) == "d" * 40
@@ -0,0 +1,350 @@
+"""
+Unit tests for server/core/translation_tts_worker.py - Translation worker batching.
+"""
+import asyncio
+import pytest
+
+from server.core import translation_tts_worker as worker_module
+from server.core.translation_tts_worker import AdjustableSemaphore, TranslationTTSWorkerSystem, drain
+
+
+class TestDrain:
+    """Test batched queue reads."""
+
+    @pytest.mark.asyncio
+    async def test_drain_takes_queued_items_up_to_limit(self):
+        """Drain returns everything already queued, capped at max_items."""
+        queue = asyncio.Queue()
+        for i in range(5):
+            queue.put_nowait(i)
+        assert await drain(queue, 3) == [0, 1, 2]
+        assert await drain(queue, 3) == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_first_item(self):
+        """Drain blocks until at least one item is available."""
+        queue = asyncio.Queue()
+        asyncio.get_running_loop().call_later(0.01, queue.put_nowait, "late")
+        assert await drain(queue, 3) == ["late"]
+
+
+class TestTranslationBatching:
+    """Test that queued texts are translated concurrently but forwarded in order."""
+
+    @pytest.mark.asyncio
+    async def test_batch_translated_concurrently_in_order(self, monkeypatch):
+        """Later texts finishing first still reach the TTS queue in arrival order."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_translate(text):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05 if text == "first" else 0.01)
+            in_flight -= 1
+            return f"ja:{text}"
+
+        monkeypatch.setattr(worker_module, "translate_to_japanese", fake_translate)
+
+        system = TranslationTTSWorkerSystem(tts_engine=None, translation_concurrency=3)
+        for i, text in enumerate(["first", "second", "third"]):
+            await system.translation_queue.put(worker_module.TranslationRequest(text=text, request_id=str(i)))
+
+        system._running = True
+        task = asyncio.create_task(system._translation_worker())
+        try:
+            await asyncio.wait_for(system.translation_queue.join(), timeout=2.0)
+        finally:
+            system._running = False
+            task.cancel()
+
+        forwarded = [system.tts_queue.get_nowait().japanese_text for _ in range(3)]
+        assert forwarded == ["ja:first", "ja:second", "ja:third"]
+        assert max_in_flight == 3
+        assert system.stats["translation_processed"] == 3
+        assert system.stats["translation_queue_waits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_item_does_not_block_batch(self, monkeypatch):
+        """A failed translation is counted and skipped; the rest are forwarded."""
+        async def fake_translate(text):
+            if text == "bad":
+                raise ValueError("invalid translation")
+            return f"ja:{text}"
+
+        monkeypatch.setattr(worker_module, "translate_to_japanese", fake_translate)
+
+        system = TranslationTTSWorkerSystem(tts_engine=None, translation_concurrency=3)
+        for i, text in enumerate(["good", "bad", "also good"]):
+            await system.translation_queue.put(worker_module.TranslationRequest(text=text, request_id=str(i)))
+
+        system._running = True
+        task = asyncio.create_task(system._translation_worker())
+        try:
+            await asyncio.wait_for(system.translation_queue.join(), timeout=2.0)
+        finally:
+            system._running = False
+            task.cancel()
+
+        assert system.tts_queue.qsize() == 2
+        assert system.stats["translation_processed"] == 2
+        assert system.stats["translation_failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_follows_ollama_num_parallel(self, monkeypatch):
+        """Without an explicit limit, in-flight translations match OLLAMA_NUM_PARALLEL."""
+        monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "2")
+        assert TranslationTTSWorkerSystem(tts_engine=None).translation_concurrency == 2
+
+        monkeypatch.delenv("OLLAMA_NUM_PARALLEL")
+        assert TranslationTTSWorkerSystem(tts_engine=None).translation_concurrency == 1
+
+    @pytest.mark.asyncio
+    async def test_single_request_starts_immediately(self, monkeypatch):
+        """A lone request is translated without waiting for more to arrive."""
+        started = asyncio.Event()
+
+        async def fake_translate(text):
+            started.set()
+            return f"ja:{text}"
+
+        monkeypatch.setattr(worker_module, "translate_to_japanese", fake_translate)
+
+        system = TranslationTTSWorkerSystem(tts_engine=None, translation_concurrency=4)
+        task = asyncio.create_task(system._translation_worker())
+        try:
+            await system.enqueue_translation("alone", request_id="1")
+            # A few loop iterations, no wall-clock wait: a batching window would
+            # still be sleeping here
+            for _ in range(5):
+                if started.is_set():
+                    break
+                await asyncio.sleep(0)
+            assert started.is_set()
+            assert system.translation_queue.empty()
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+class TestWorkerShutdown:
+    """Test sentinel-based worker shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_without_cancelling(self):
+        """Idle workers exit on the stop sentinel instead of being cancelled."""
+        system = TranslationTTSWorkerSystem(tts_engine=None)
+        await system.start()
+        tasks = [system._translation_worker_task, system._tts_worker_task, system._audio_play_worker_task]
+
+        await asyncio.wait_for(system.stop(timeout=1.0), timeout=0.5)
+
+        assert all(task.done() and not task.cancelled() for task in tasks)
+
+    @pytest.mark.asyncio
+    async def test_stop_finishes_queued_translation(self, monkeypatch):
+        """Requests queued before stop() are still translated."""
+        async def fake_translate(text):
+            await asyncio.sleep(0.01)
+            return f"ja:{text}"
+
+        monkeypatch.setattr(worker_module, "translate_to_japanese", fake_translate)
+
+        system = TranslationTTSWorkerSystem(tts_engine=None)
+        system._running = True
+        task = asyncio.create_task(system._translation_worker())
+        await system.enqueue_translation("queued", request_id="1")
+        await system.translation_queue.put(None)
+
+        await asyncio.wait_for(task, timeout=1.0)
+        assert system.tts_queue.get_nowait().japanese_text == "ja:queued"
+        assert system.tts_queue.get_nowait() is None  # Sentinel follows the last text
+
+    @pytest.mark.asyncio
+    async def test_stop_plays_everything_queued(self, monkeypatch):
+        """With finish_queued, texts queued before stop() are all played before the workers exit."""
+        async def fake_translate(text):
+            await asyncio.sleep(0.01)
+            return f"ja:{text}"
+
+        monkeypatch.setattr(worker_module, "translate_to_japanese", fake_translate)
+
+        engine = FakeTTSEngine({"ja:0": 0.02})
+        system = TranslationTTSWorkerSystem(engine, tts_queue_max=1, audio_queue_max=1)
+        played = []
+
+        async def fake_play(audio_path):
+            await asyncio.sleep(0.01)
+            played.append(audio_path.name)
+
+        monkeypatch.setattr(system, "_play_audio", fake_play)
+
+        await system.start()
+        tasks = [system._translation_worker_task, system._tts_worker_task, system._audio_play_worker_task]
+        for i in range(3):
+            await system.enqueue_translation(str(i), request_id=str(i))
+
+        await asyncio.wait_for(system.stop(timeout=2.0, finish_queued=True), timeout=1.0)
+
+        assert played == ["tts_0.wav", "tts_1.wav", "tts_2.wav"]
+        assert system.stats["translation_processed"] == 3
+        assert system.stats["tts_processed"] == 3
+        assert system.stats["audio_play_processed"] == 3
+        assert all(task.done() and not task.cancelled() for task in tasks)
+
+    @pytest.mark.asyncio
+    async def test_stop_discards_queued_by_default(self, monkeypatch):
+        """A default stop() drops queued and in-flight work instead of playing it."""
+        translating = asyncio.Event()
+
+        async def fake_translate(text):
+            translating.set()
+            await asyncio.sleep(0.02)
+            return f"ja:{text}"
+
+        monkeypatch.setattr(worker_module, "translate_to_japanese", fake_translate)
+
+        system = TranslationTTSWorkerSystem(FakeTTSEngine({}))
+        played = []
+
+        async def fake_play(audio_path):
+            played.append(audio_path.name)
+
+        monkeypatch.setattr(system, "_play_audio", fake_play)
+
+        await system.start()
+        tasks = [system._translation_worker_task, system._tts_worker_task, system._audio_play_worker_task]
+        for i in range(3):
+            await system.enqueue_translation(str(i), request_id=str(i))
+        await asyncio.wait_for(translating.wait(), timeout=1.0)  # "0" is in flight, "1" and "2" queued
+
+        await asyncio.wait_for(system.stop(), timeout=1.0)
+
+        assert played == []
+        assert system.stats["tts_processed"] == 0
+        assert all(task.done() and not task.cancelled() for task in tasks)
+
+
+class FakeTTSEngine:
+    """TTS engine stub: synthesis time depends on the text, no files are written."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def synthesize_to_file(self, text, request_id=None):
+        from pathlib import Path
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delays.get(text, 0))
+        self.in_flight -= 1
+        return Path(f"tts_{request_id}.wav")
+
+
+class TestTTSConcurrency:
+    """Test bounded TTS parallelism with ordered playback."""
+
+    async def _run_tts(self, system, texts):
+        for i, text in enumerate(texts):
+            await system.tts_queue.put(worker_module.TTSRequest(japanese_text=text, request_id=str(i)))
+        await system.tts_queue.put(None)
+        await asyncio.wait_for(system._tts_worker(), timeout=2.0)
+        forwarded = [system.audio_play_queue.get_nowait() for _ in range(system.audio_play_queue.qsize())]
+        assert forwarded[-1] is None  # Stop sentinel passed on after the last clip
+        return [req.request_id for req in forwarded[:-1]]
+
+    @pytest.mark.asyncio
+    async def test_overlapping_synthesis_keeps_play_order(self):
+        """A slow first synthesis doesn't let later clips play first."""
+        engine = FakeTTSEngine({"slow": 0.05})
+        system = TranslationTTSWorkerSystem(engine, tts_concurrency=2)
+
+        played = await self._run_tts(system, ["slow", "fast", "fast again"])
+
+        assert played == ["0", "1", "2"]
+        assert engine.max_in_flight == 2
+        assert system.stats["tts_processed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_default_concurrency_is_serial(self):
+        """With the default of 1, only one synthesis runs at a time."""
+        engine = FakeTTSEngine({"a": 0.01, "b": 0.01})
+        system = TranslationTTSWorkerSystem(engine)
+
+        played = await self._run_tts(system, ["a", "b"])
+
+        assert played == ["0", "1"]
+        assert engine.max_in_flight == 1
+
+
+class TestAdjustableSemaphore:
+    """Test the resizable TTS concurrency limit."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_blocks_at_limit(self):
+        """A second acquire waits until the first holder releases."""
+        sem = AdjustableSemaphore(1)
+        await sem.acquire()
+        waiter = asyncio.create_task(sem.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await sem.release()
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert sem.in_use == 1
+
+    @pytest.mark.asyncio
+    async def test_raising_limit_wakes_waiters(self):
+        """Waiters proceed as soon as the limit is raised."""
+        sem = AdjustableSemaphore(1)
+        await sem.acquire()
+        waiters = [asyncio.create_task(sem.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        await sem.set_limit(3)
+        await asyncio.wait_for(asyncio.gather(*waiters), timeout=1.0)
+        assert sem.in_use == 3
+
+    @pytest.mark.asyncio
+    async def test_lowering_limit_blocks_new_acquires(self):
+        """Current holders keep their slots, new acquires wait for the lower limit."""
+        sem = AdjustableSemaphore(2)
+        await sem.acquire()
+        await sem.acquire()
+        await sem.set_limit(1)
+
+        waiter = asyncio.create_task(sem.acquire())
+        await sem.release()
+        await asyncio.sleep(0)
+        assert not waiter.done()  # 1 in use, limit 1
+
+        await sem.release()
+        await asyncio.wait_for(waiter, timeout=1.0)
+
+
+class TestBackpressure:
+    """Test bounded queues between workers."""
+
+    @pytest.mark.asyncio
+    async def test_full_audio_queue_stops_tts_intake(self):
+        """With playback stalled, the TTS worker stops taking new texts."""
+        engine = FakeTTSEngine({})
+        system = TranslationTTSWorkerSystem(engine, tts_queue_max=2, audio_queue_max=1)
+        task = asyncio.create_task(system._tts_worker())
+        try:
+            for i in range(3):
+                await asyncio.wait_for(
+                    system.tts_queue.put(worker_module.TTSRequest(japanese_text="x", request_id=str(i))),
+                    timeout=1.0
+                )
+            await asyncio.sleep(0.05)
+
+            # One clip waits for playback, one is held waiting for room, one stays queued
+            assert system.audio_play_queue.qsize() == 1
+            assert system.tts_queue.qsize() == 1
+            assert system.stats["queue_full_warnings"] == 1
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
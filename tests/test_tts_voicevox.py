@@ -0,0 +1,123 @@
+"""
+Unit tests for server/core/tts_voicevox.py - WAV cache and streamed file output.
+
+These tests run without VOICEVOX: HTTP calls go to a fake session.
+"""
+import pytest
+
+from server.core import tts_voicevox
+from server.core.tts_voicevox import VoicevoxEngine
+
+
+class FakeContent:
+    def __init__(self, payload):
+        self.payload = payload
+
+    async def iter_chunked(self, n):
+        for i in range(0, len(self.payload), n):
+            yield self.payload[i:i + n]
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+        self.content = FakeContent(payload)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """Records POSTs; /synthesis returns WAV bytes derived from the query text."""
+
+    def __init__(self):
+        self.posts = []
+
+    def post(self, url, params=None, json=None):
+        self.posts.append(url.rsplit("/", 1)[-1])
+        if url.endswith("/audio_query"):
+            return FakeResponse({"text": params["text"]})
+        return FakeResponse(f"RIFF:{json['text']}".encode("utf-8"))
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = VoicevoxEngine()
+    session = FakeSession()
+
+    async def get_session():
+        return session
+
+    monkeypatch.setattr(engine, "_get_session", get_session)
+    engine.fake_session = session
+    return engine
+
+
+class TestWavCache:
+    """Test that repeated phrases skip VOICEVOX."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_uses_cache(self, engine):
+        """Second synthesis of the same text makes no HTTP calls."""
+        first = await engine.synthesize("完了しました")
+        second = await engine.synthesize("完了しました")
+        assert first == second == "RIFF:完了しました".encode("utf-8")
+        assert engine.fake_session.posts == ["audio_query", "synthesis"]
+
+    @pytest.mark.asyncio
+    async def test_voice_parameters_are_part_of_key(self, engine):
+        """A different speed is synthesized again, not served from cache."""
+        await engine.synthesize("完了しました")
+        await engine.synthesize("完了しました", speed_scale=1.2)
+        assert engine.fake_session.posts.count("synthesis") == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_clip_evicted(self, engine, monkeypatch):
+        """The cache keeps at most TTS_CACHE_SIZE clips, dropping the oldest."""
+        monkeypatch.setattr(tts_voicevox, "TTS_CACHE_SIZE", 2)
+        await engine.synthesize("一")
+        await engine.synthesize("二")
+        await engine.synthesize("一")  # Refresh: "二" is now the oldest
+        await engine.synthesize("三")
+
+        engine.fake_session.posts.clear()
+        await engine.synthesize("一")
+        await engine.synthesize("二")
+        assert engine.fake_session.posts == ["audio_query", "synthesis"]
+
+
+class TestSynthesizeToFile:
+    """Test streaming synthesis output into the WAV file."""
+
+    @pytest.mark.asyncio
+    async def test_streams_chunks_into_file(self, engine, tmp_path, monkeypatch):
+        """A multi-chunk response is written to the file in full."""
+        monkeypatch.setattr(tts_voicevox, "SYNTHESIS_CHUNK_SIZE", 4)
+        engine.output_dir = tmp_path
+
+        path = await engine.synthesize_to_file("こんにちは", request_id="abc")
+
+        assert path == tmp_path / "tts_abc.wav"
+        assert path.read_bytes() == "RIFF:こんにちは".encode("utf-8")
+        # Streamed clip is still cached for the next request
+        assert await engine.synthesize("こんにちは") == path.read_bytes()
+        assert engine.fake_session.posts.count("synthesis") == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_synthesis_leaves_no_file(self, engine, tmp_path):
+        """Errors remove the partially written file."""
+        engine.output_dir = tmp_path
+
+        with pytest.raises(ValueError):
+            await engine.synthesize_to_file("   ", request_id="empty")
+
+        assert not (tmp_path / "tts_empty.wav").exists()